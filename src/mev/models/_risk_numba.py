@@ -0,0 +1,31 @@
+"""
+JIT-compiled scalar risk kernel
+
+Native-code core of MEVRiskModel.calculate_risk for per-transaction
+callers (subscriber fan-out, real-time scoring) where the NumPy batch
+path's dispatch overhead dominates. Compiled with numba when available;
+the pure-Python definition is used otherwise.
+"""
+
+import math
+
+try:
+    import numba as nb
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    nb = None
+
+
+def _risk_core(tx_value, p_exploit, congestion,
+               base_risk, value_sensitivity, congestion_factor,
+               searcher_density):
+    """Scalar game-theoretic risk formula over plain floats."""
+    value_factor = value_sensitivity * math.log1p(tx_value)
+    competition_factor = 1.0 + math.tanh(searcher_density * 3.0)
+    risk = (base_risk
+            + (p_exploit * value_factor * competition_factor)
+            / (1.0 + congestion_factor * congestion))
+    return risk if tx_value == 0.0 else min(risk, tx_value * 0.95)
+
+
+if nb is not None:
+    _risk_core = nb.njit(cache=True, fastmath=True)(_risk_core)
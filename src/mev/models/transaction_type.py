@@ -5,11 +5,16 @@ Extracted from AxionCitadel - Operation First Light validated
 Each transaction type has different MEV exploitation probabilities
 """
 
-from enum import Enum
+from enum import IntEnum
 
 
-class TransactionType(Enum):
-    """Transaction types with different MEV risk profiles"""
+class TransactionType(IntEnum):
+    """Transaction types with different MEV risk profiles
+
+    IntEnum so members hash and compare as plain ints: dict lookups keyed
+    by transaction type (frontrun probabilities) hash the integer value
+    instead of the member name string.
+    """
     ARBITRAGE = 1
     LIQUIDITY_PROVISION = 2
     FLASH_LOAN = 3
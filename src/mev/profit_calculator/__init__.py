@@ -5,12 +5,13 @@ This module provides game-theoretic MEV risk modeling for arbitrage profit calcu
 
 from .transaction_type import TransactionType
 from .mev_risk_model import MEVRiskModel
-from .profit_calculator import ProfitCalculator
+from .profit_calculator import ProfitCalculator, ProfitResult
 from .mempool_simulator import MempoolSimulator
 
 __all__ = [
     'TransactionType',
     'MEVRiskModel',
     'ProfitCalculator',
+    'ProfitResult',
     'MempoolSimulator'
 ]
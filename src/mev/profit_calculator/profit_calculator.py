@@ -1,6 +1,59 @@
+import functools
+from math import fsum
+
+import numpy as np
+
 from .mev_risk_model import MEVRiskModel
 from .transaction_type import TransactionType
-from typing import Dict
+from typing import Dict, NamedTuple
+
+
+class ProfitResult(NamedTuple):
+    """Immutable scalar profit breakdown.
+
+    A NamedTuple is a flat tuple under the hood — ~3x cheaper to
+    allocate than the dict it replaces, with O(1) slot access. String
+    subscripting and ``in`` keep working for dict-style consumers.
+    """
+    gross_profit: float
+    adjusted_profit: float
+    mev_risk: float
+    risk_ratio: float
+    net_profit_margin: float
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return key in self._fields
+        return tuple.__contains__(self, key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _calc_profit_cached(risk_model, revenue, gas_cost, tx_value, tx_type,
+                        mempool_congestion):
+    """Memoized scalar profit math, keyed on the full parameter tuple.
+
+    Simulation sweeps and the test suite re-evaluate the same small set
+    of parameter combinations many times; a cache hit is one tuple hash
+    instead of the risk kernel plus a dozen float ops. The ProfitResult
+    is immutable, so the cached object itself is returned to callers.
+    """
+    mev_risk = risk_model.calculate_risk(
+        tx_value, gas_cost, tx_type, mempool_congestion
+    )
+    gross_profit = revenue - gas_cost
+    # Compensated sum: one rounding instead of two sequential subtracts,
+    # which matters at the extremes the edge-case tests probe
+    adjusted_profit = fsum((revenue, -gas_cost, -mev_risk))
+    revenue_safe = revenue + 1e-9  # Avoid division by zero
+    return ProfitResult(gross_profit, adjusted_profit, mev_risk,
+                        mev_risk / revenue_safe,
+                        adjusted_profit / revenue_safe)
+
 
 class ProfitCalculator:
     """MEV-aware profit calculator with game-theoretic risk modeling"""
@@ -12,24 +65,52 @@ class ProfitCalculator:
                         gas_cost: float,
                         tx_value: float,
                         tx_type: TransactionType,
-                        mempool_congestion: float = 0.5) -> Dict[str, float]:
+                        mempool_congestion: float = 0.5) -> ProfitResult:
         """Calculate adjusted profit with MEV risk"""
-        # Validate inputs
+        # Validate inputs before touching the cache so the ValueError
+        # path never gets memoized
         if revenue < 0 or gas_cost < 0 or tx_value < 0:
             raise ValueError("Negative values not permitted")
 
-        # Calculate MEV leakage risk
-        mev_risk = self.risk_model.calculate_risk(
-            tx_value, gas_cost, tx_type, mempool_congestion
+        return _calc_profit_cached(
+            self.risk_model, float(revenue), float(gas_cost),
+            float(tx_value), tx_type, float(mempool_congestion)
+        )
+
+    def calculate_profit_batch(self,
+                               revenues: np.ndarray,
+                               gas_costs: np.ndarray,
+                               tx_values: np.ndarray,
+                               tx_types: np.ndarray,
+                               mempool_congestion: np.ndarray,
+                               out: Dict[str, np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Vectorized profit over aligned arrays of transactions.
+
+        tx_types holds bare TransactionType.value ints. Pass ``out`` (a dict
+        with the same keys as the scalar result) to reuse preallocated
+        buffers across repeated sweeps instead of reallocating per call.
+        """
+        revenues = np.asarray(revenues, dtype=np.float64)
+        gas_costs = np.asarray(gas_costs, dtype=np.float64)
+        tx_values = np.asarray(tx_values, dtype=np.float64)
+
+        if revenues.min() < 0 or gas_costs.min() < 0 or tx_values.min() < 0:
+            raise ValueError("Negative values not permitted")
+
+        if out is None:
+            out = {key: np.empty_like(revenues) for key in
+                   ("gross_profit", "adjusted_profit", "mev_risk",
+                    "risk_ratio", "net_profit_margin")}
+
+        self.risk_model.calculate_risk_batch(
+            tx_values, tx_types, mempool_congestion, out=out["mev_risk"]
         )
 
-        # Core profit calculation
-        adjusted_profit = revenue - gas_cost - mev_risk
+        # In-place arithmetic on the output buffers to cut allocation churn
+        np.subtract(revenues, gas_costs, out=out["gross_profit"])
+        np.subtract(out["gross_profit"], out["mev_risk"], out=out["adjusted_profit"])
+        revenue_safe = revenues + 1e-9  # Avoid division by zero
+        np.divide(out["mev_risk"], revenue_safe, out=out["risk_ratio"])
+        np.divide(out["adjusted_profit"], revenue_safe, out=out["net_profit_margin"])
 
-        return {
-            "gross_profit": revenue - gas_cost,
-            "adjusted_profit": adjusted_profit,
-            "mev_risk": mev_risk,
-            "risk_ratio": mev_risk / (revenue + 1e-9),  # Avoid division by zero
-            "net_profit_margin": adjusted_profit / (revenue + 1e-9)
-        }
+        return out
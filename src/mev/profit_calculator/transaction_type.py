@@ -1,6 +1,6 @@
-from enum import Enum
+from enum import IntEnum
 
-class TransactionType(Enum):
+class TransactionType(IntEnum):
     ARBITRAGE = 1
     LIQUIDITY_PROVISION = 2
     FLASH_LOAN = 3
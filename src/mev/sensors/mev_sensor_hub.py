@@ -1,4 +1,9 @@
 import time
+from collections import namedtuple
+
+# Slotted cache entry: avoids per-hit tuple unpacking in _is_cache_valid
+CacheEntry = namedtuple('CacheEntry', ['value', 'timestamp'])
+
 
 class MEVSensorHub:
     def __init__(self):
@@ -7,54 +12,66 @@ class MEVSensorHub:
         self.cache = {}
         self.cache_ttl = 12
 
-    def _cache_result(self, key, value):
-        self.cache[key] = (value, time.time())
+    def _cache_result(self, key, value, now=None):
+        self.cache[key] = CacheEntry(value, now if now is not None else time.time())
 
-    def _is_cache_valid(self, key):
-        cached_value = self.cache.get(key)
-        if cached_value:
-            value, timestamp = cached_value
-            if time.time() - timestamp < self.cache_ttl:
-                return value
+    def _is_cache_valid(self, key, now=None):
+        entry = self.cache.get(key)
+        if entry:
+            if now is None:
+                now = time.time()
+            if now - entry.timestamp < self.cache_ttl:
+                return entry.value
         return None
 
-    def get_congestion_score(self):
-        cached_result = self._is_cache_valid('congestion_score')
+    def get_congestion_score(self, now=None):
+        cached_result = self._is_cache_valid('congestion_score', now)
         if cached_result is not None:
             return cached_result
         congestion_score = self.mempool_congestion_sensor.get_score()
-        self._cache_result('congestion_score', congestion_score)
+        self._cache_result('congestion_score', congestion_score, now)
         return congestion_score
 
-    def get_density_score(self):
-        cached_result = self._is_cache_valid('density_score')
+    def get_density_score(self, now=None):
+        cached_result = self._is_cache_valid('density_score', now)
         if cached_result is not None:
             return cached_result
         density_score = self.searcher_density_sensor.get_density()
-        self._cache_result('density_score', density_score)
+        self._cache_result('density_score', density_score, now)
         return density_score
 
-    def calculate_composite_risk(self):
-        density = self.get_density_score()
-        congestion = self.get_congestion_score()
+    def calculate_composite_risk(self, now=None):
+        # Cached under the same TTL as the underlying sensor scores, so a
+        # get_metrics call never recomputes the formula for fresh inputs
+        cached_result = self._is_cache_valid('composite_risk', now)
+        if cached_result is not None:
+            return cached_result
+        density = self.get_density_score(now)
+        congestion = self.get_congestion_score(now)
         composite_risk = density * (1 - congestion * 0.5)
+        self._cache_result('composite_risk', composite_risk, now)
         return composite_risk
 
     def get_metrics(self):
-        congestion_score = self.get_congestion_score()
-        density_score = self.get_density_score()
-        composite_risk = self.calculate_composite_risk()
+        # Read the clock once per query and thread it through every cache
+        # check instead of issuing a syscall per lookup
+        now = time.time()
+        congestion_score = self.get_congestion_score(now)
+        density_score = self.get_density_score(now)
+        composite_risk = self.calculate_composite_risk(now)
         return {
             "congestion_score": congestion_score,
             "density_score": density_score,
             "composite_risk": composite_risk
         }
 
+
 class MempoolCongestionSensor:
     def get_score(self):
         # Placeholder for actual congestion logic
         return 0.7  # Example value
 
+
 class SearcherDensitySensor:
     def get_density(self):
         # Placeholder for actual density logic
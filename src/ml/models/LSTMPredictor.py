@@ -11,9 +11,12 @@ import numpy as np
 from typing import List, Tuple, Dict, Optional
 import tensorflow as tf
 from tensorflow import keras
-from tensorflow.keras import layers
+from tensorflow.keras import layers, mixed_precision
 from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint, ReduceLROnPlateau
-import tensorflowjs as tfjs
+
+# BF16 matmuls (tensor cores on Ampere+, AVX512-BF16 on x86) with FP32
+# variables/loss: ~2x training throughput at half the activation memory
+mixed_precision.set_global_policy('mixed_bfloat16')
 
 
 class LSTMPredictor:
@@ -44,57 +47,185 @@ class LSTMPredictor:
         self.model = None
         self.history = None
         self.scaler_params = None
+        self._ort_session = None
+        self._ort_input_name = None
+        self._is_pruned = False
+        self._predict_fn = None
+        self._interpreter = None
+        self._tflite_input_idx = None
+        self._tflite_output_idx = None
         
         # Create model directory
         os.makedirs(model_path, exist_ok=True)
     
-    def build_model(self) -> keras.Model:
+    def build_model(self, normalization_data: Optional[np.ndarray] = None) -> keras.Model:
         """
         Build LSTM model architecture
-        
+
+        Args:
+            normalization_data: Training features to adapt an input
+                Normalization layer on. Folds the feature scaling into the
+                graph itself, so inference skips the separate scaler pass
+                and the stats persist inside the saved model.
+
         Returns:
             Compiled Keras model
         """
         # Input layer
         inputs = keras.Input(shape=(self.sequence_length, self.feature_dim))
-        
-        # LSTM layers with dropout for regularization
-        x = layers.LSTM(128, return_sequences=True)(inputs)
-        x = layers.Dropout(0.2)(x)
-        
+        x = inputs
+
+        if normalization_data is not None:
+            norm = layers.Normalization(axis=-1, name='input_norm')
+            norm.adapt(normalization_data)
+            x = norm(x)
+
+        # LSTM stack without inter-layer Dropout so each layer dispatches to
+        # the fused CuDNN kernel on GPU; a single post-stack Dropout keeps
+        # the regularization
+        x = layers.LSTM(128, return_sequences=True)(x)
         x = layers.LSTM(64, return_sequences=True)(x)
-        x = layers.Dropout(0.2)(x)
-        
         x = layers.LSTM(32, return_sequences=False)(x)
         x = layers.Dropout(0.2)(x)
         
-        # Dense layers for each prediction horizon
-        outputs = []
-        for horizon in self.prediction_horizons:
-            output = layers.Dense(32, activation='relu', name=f'dense_{horizon}s')(x)
-            output = layers.Dropout(0.1)(output)
-            # Output: [predicted_price, confidence_lower, confidence_upper]
-            output = layers.Dense(3, activation='linear', name=f'pred_{horizon}s')(output)
-            outputs.append(output)
-        
+        # Single fused output head covering all horizons: one large GEMM
+        # instead of one launch-bound small matmul per horizon.
+        # Output per horizon: [predicted_price, confidence_lower, confidence_upper]
+        # Output head stays FP32 to preserve prediction range under the
+        # mixed-precision policy
+        n_horizons = len(self.prediction_horizons)
+        shared = layers.Dense(32 * n_horizons, activation='relu', name='dense_all')(x)
+        shared = layers.Dropout(0.1)(shared)
+        outputs = layers.Dense(
+            3 * n_horizons, activation='linear', dtype='float32'
+        )(shared)
+        outputs = layers.Reshape((n_horizons, 3), name='pred_all', dtype='float32')(outputs)
+
         # Build model
         model = keras.Model(inputs=inputs, outputs=outputs)
         
-        # Compile with Adam optimizer
+        # Compile with Adam optimizer; LossScaleOptimizer is a no-op for
+        # BF16 but keeps the path ready for FP16 policies
         model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=0.001),
+            optimizer=mixed_precision.LossScaleOptimizer(
+                keras.optimizers.Adam(learning_rate=0.001)
+            ),
             loss='mse',
             metrics=['mae']
         )
         
         self.model = model
+        self._predict_fn = None
         return model
     
+    def build_qat_model(self) -> keras.Model:
+        """
+        Build a quantization-aware training version of the model
+
+        Inserts fake-quant nodes so the network learns int8-robust weights
+        during training; post-training quantization alone can collapse
+        accuracy on an LSTM stack this small. Train via the normal train()
+        path, then export_tflite produces an int8 graph whose quantization
+        error is already baked into the loss.
+
+        Returns:
+            Compiled quantize-annotated Keras model
+        """
+        try:
+            import tensorflow_model_optimization as tfmot
+        except ImportError as e:
+            raise ImportError(
+                f"Quantization-aware training requires tensorflow-model-optimization: {e}"
+            )
+
+        if self.model is None:
+            self.build_model()
+
+        q_model = tfmot.quantization.keras.quantize_model(self.model)
+
+        # Recompile with the same optimizer/loss as build_model
+        q_model.compile(
+            optimizer=keras.optimizers.Adam(learning_rate=0.001),
+            loss='mse',
+            metrics=['mae']
+        )
+
+        self.model = q_model
+        self._predict_fn = None
+        return q_model
+
+    def build_pruned_model(self, end_step: int, final_sparsity: float = 0.5) -> keras.Model:
+        """
+        Wrap the model for magnitude-based weight pruning during training
+
+        Ramps sparsity polynomially from 0 to final_sparsity over training;
+        half the LSTM weights can typically be zeroed on a noisy
+        time-series task without accuracy loss. Call strip_pruning() after
+        training to drop the wrappers before export — the sparse weights
+        then compress 2-4x on disk and let sparse CPU kernels skip
+        zero blocks. Cascades with the int8 TFLite export.
+
+        Args:
+            end_step: Training step at which final sparsity is reached
+                (num_batches_per_epoch * epochs)
+            final_sparsity: Target fraction of zeroed weights
+
+        Returns:
+            Compiled prune-annotated Keras model
+        """
+        try:
+            import tensorflow_model_optimization as tfmot
+        except ImportError as e:
+            raise ImportError(
+                f"Weight pruning requires tensorflow-model-optimization: {e}"
+            )
+
+        if self.model is None:
+            self.build_model()
+
+        pruning_schedule = tfmot.sparsity.keras.PolynomialDecay(
+            initial_sparsity=0.0,
+            final_sparsity=final_sparsity,
+            begin_step=0,
+            end_step=end_step
+        )
+        pruned = tfmot.sparsity.keras.prune_low_magnitude(
+            self.model, pruning_schedule=pruning_schedule
+        )
+
+        pruned.compile(
+            optimizer=keras.optimizers.Adam(learning_rate=0.001),
+            loss='mse',
+            metrics=['mae']
+        )
+
+        self.model = pruned
+        self._is_pruned = True
+        self._predict_fn = None
+        return pruned
+
+    def strip_pruning(self) -> keras.Model:
+        """
+        Remove pruning wrappers after training, keeping the sparse weights
+
+        Returns:
+            Stripped Keras model ready for save/export
+        """
+        if not self._is_pruned:
+            return self.model
+
+        import tensorflow_model_optimization as tfmot
+
+        self.model = tfmot.sparsity.keras.strip_pruning(self.model)
+        self._is_pruned = False
+        self._predict_fn = None
+        return self.model
+
     def prepare_sequences(
         self,
         data: np.ndarray,
         targets: np.ndarray
-    ) -> Tuple[np.ndarray, List[np.ndarray]]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Prepare time-series sequences for training
         
@@ -104,38 +235,46 @@ class LSTMPredictor:
         
         Returns:
             X: Input sequences [n_sequences, sequence_length, n_features]
-            y: Target sequences [n_horizons x [n_sequences, 3]]
+            y: Target sequences [n_sequences, n_horizons, 3]
         """
-        X = []
-        y_list = [[] for _ in self.prediction_horizons]
-        
-        # Create sequences
-        for i in range(len(data) - self.sequence_length - max(self.prediction_horizons)):
-            # Input sequence
-            X.append(data[i:i + self.sequence_length])
-            
-            # Targets for each horizon
-            for j, horizon in enumerate(self.prediction_horizons):
-                target_idx = i + self.sequence_length + horizon
-                if target_idx < len(targets):
-                    # Target: [price, lower_bound, upper_bound]
-                    target_price = targets[target_idx, j]
-                    # Estimate confidence intervals (±2%)
-                    lower = target_price * 0.98
-                    upper = target_price * 1.02
-                    y_list[j].append([target_price, lower, upper])
-        
-        X = np.array(X)
-        y = [np.array(y_h) for y_h in y_list]
-        
+        # Float32 contiguous inputs at the boundary: callers often hand in
+        # float64 (np.random.randn, pandas .values), which would double the
+        # bandwidth and force a hidden cast inside the tf.data pipeline
+        data = np.ascontiguousarray(data, dtype=np.float32)
+        targets = np.ascontiguousarray(targets, dtype=np.float32)
+
+        n_sequences = len(data) - self.sequence_length - max(self.prediction_horizons)
+        n_horizons = len(self.prediction_horizons)
+
+        # Input sequences: one copy from the strided window view into a
+        # preallocated contiguous float32 buffer (half the bandwidth of the
+        # default float64, and the layout training kernels want)
+        windows = np.lib.stride_tricks.sliding_window_view(
+            data, (self.sequence_length, data.shape[1])
+        ).squeeze(1)
+        X = np.empty(
+            (n_sequences, self.sequence_length, data.shape[1]), dtype=np.float32
+        )
+        np.copyto(X, windows[:n_sequences])
+
+        # Targets per horizon: [price, lower_bound, upper_bound] with
+        # confidence intervals estimated at ±2%, written straight into the
+        # (n_sequences, n_horizons, 3) tensor the fused head expects
+        y = np.empty((n_sequences, n_horizons, 3), dtype=np.float32)
+        for j, horizon in enumerate(self.prediction_horizons):
+            start = self.sequence_length + horizon
+            y[:, j, 0] = targets[start:start + n_sequences, j]
+            np.multiply(y[:, j, 0], 0.98, out=y[:, j, 1])
+            np.multiply(y[:, j, 0], 1.02, out=y[:, j, 2])
+
         return X, y
     
     def train(
         self,
         X_train: np.ndarray,
-        y_train: List[np.ndarray],
+        y_train: np.ndarray,
         X_val: np.ndarray,
-        y_val: List[np.ndarray],
+        y_val: np.ndarray,
         epochs: int = 100,
         batch_size: int = 32,
         patience: int = 10
@@ -145,7 +284,7 @@ class LSTMPredictor:
         
         Args:
             X_train: Training sequences
-            y_train: Training targets (list for each horizon)
+            y_train: Training targets [n_sequences, n_horizons, 3]
             X_val: Validation sequences
             y_val: Validation targets
             epochs: Maximum training epochs
@@ -157,7 +296,10 @@ class LSTMPredictor:
         """
         if self.model is None:
             self.build_model()
-        
+
+        assert X_train.dtype == np.float32 and X_train.flags['C_CONTIGUOUS'], \
+            "X_train must be contiguous float32 (use prepare_sequences)"
+
         # Callbacks
         callbacks = [
             EarlyStopping(
@@ -180,14 +322,23 @@ class LSTMPredictor:
                 verbose=1
             )
         ]
-        
+
+        if self._is_pruned:
+            import tensorflow_model_optimization as tfmot
+            callbacks.append(tfmot.sparsity.keras.UpdatePruningStep())
+
+        # tf.data with prefetch overlaps the host->device copy of the next
+        # batch with compute on the current one
+        train_ds = tf.data.Dataset.from_tensor_slices((X_train, y_train)) \
+            .batch(batch_size).prefetch(tf.data.AUTOTUNE)
+        val_ds = tf.data.Dataset.from_tensor_slices((X_val, y_val)) \
+            .batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
         # Train model
         self.history = self.model.fit(
-            X_train,
-            y_train,
-            validation_data=(X_val, y_val),
+            train_ds,
+            validation_data=val_ds,
             epochs=epochs,
-            batch_size=batch_size,
             callbacks=callbacks,
             verbose=1
         )
@@ -207,12 +358,26 @@ class LSTMPredictor:
         if self.model is None:
             raise ValueError("Model not built or loaded")
         
-        predictions = self.model.predict(X)
+        # Compile the forward pass once: a cached XLA-jitted tf.function
+        # avoids per-call retracing/dispatch overhead in the trading loop
+        # and fuses the elementwise ops in the dense head
+        if self._predict_fn is None:
+            self._predict_fn = tf.function(
+                lambda x: self.model(x, training=False),
+                jit_compile=True,
+                input_signature=[tf.TensorSpec(
+                    (None, self.sequence_length, self.feature_dim), tf.float32
+                )]
+            )
+        
+        predictions = self._predict_fn(
+            tf.convert_to_tensor(X, dtype=tf.float32)
+        ).numpy()
         
-        # Format predictions
+        # Format predictions: fused head emits [n_sequences, n_horizons, 3]
         results = []
         for i, horizon in enumerate(self.prediction_horizons):
-            pred = predictions[i] if len(self.prediction_horizons) > 1 else predictions
+            pred = predictions[:, i, :]
             results.append({
                 'horizon': horizon,
                 'predicted_price': pred[:, 0],
@@ -222,12 +387,17 @@ class LSTMPredictor:
         
         return results
     
-    def save_model(self, version: str = 'v1'):
+    def save_model(self, version: str = 'v1', save_tfjs: bool = False,
+                   save_tflite: bool = True):
         """
         Save model to disk in multiple formats
         
         Args:
             version: Model version string
+            save_tfjs: Also export TensorFlow.js shards for Node.js inference.
+                Off by default: the conversion re-serializes the whole graph
+                and is dead weight for Python-only checkpointing.
+            save_tflite: Also export the quantized TFLite flatbuffer
         """
         if self.model is None:
             raise ValueError("No model to save")
@@ -237,10 +407,17 @@ class LSTMPredictor:
         self.model.save(keras_path)
         print(f"Saved Keras model to {keras_path}")
         
-        # Save as TensorFlow.js format for Node.js inference
-        tfjs_path = os.path.join(self.model_path, f'tfjs_{version}')
-        tfjs.converters.save_keras_model(self.model, tfjs_path)
-        print(f"Saved TensorFlow.js model to {tfjs_path}")
+        if save_tfjs:
+            # Lazy import: tfjs drags in its own graph tooling (~seconds)
+            import tensorflowjs as tfjs
+            tfjs_path = os.path.join(self.model_path, f'tfjs_{version}')
+            tfjs.converters.save_keras_model(self.model, tfjs_path)
+            print(f"Saved TensorFlow.js model to {tfjs_path}")
+
+        if save_tflite:
+            # TFLite with dynamic-range int8 quantization for CPU inference
+            # (~4x smaller on disk, int8 MatMul kernels for the LSTM gates)
+            self.export_tflite(version)
         
         # Save metadata
         metadata = {
@@ -256,10 +433,313 @@ class LSTMPredictor:
             json.dump(metadata, f, indent=2)
         print(f"Saved metadata to {metadata_path}")
     
+    def export_tflite(
+        self,
+        version: str = 'v1',
+        representative_dataset=None
+    ) -> str:
+        """
+        Export model to TFLite with int8 quantization for CPU inference
+
+        By default applies post-training dynamic-range quantization (int8
+        weights, on-the-fly activation quantization). When a representative
+        dataset generator is supplied, produces a fully int8 graph instead.
+
+        Args:
+            version: Model version string
+            representative_dataset: Generator yielding sample input batches
+                (~100 real windows from prepare_sequences) for full int8
+
+        Returns:
+            Path to the .tflite file
+        """
+        if self.model is None:
+            raise ValueError("No model to export")
+
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+        if representative_dataset is not None:
+            converter.representative_dataset = representative_dataset
+            converter.target_spec.supported_ops = [
+                tf.lite.OpsSet.TFLITE_BUILTINS_INT8
+            ]
+            converter.inference_input_type = tf.int8
+            converter.inference_output_type = tf.int8
+
+        tflite_model = converter.convert()
+
+        tflite_path = os.path.join(self.model_path, f'lstm_model_{version}.tflite')
+        with open(tflite_path, 'wb') as f:
+            f.write(tflite_model)
+        print(f"Saved TFLite model to {tflite_path}")
+
+        return tflite_path
+
+    def predict_tflite(self, X: np.ndarray, version: str = 'v1') -> List[Dict[str, np.ndarray]]:
+        """
+        Make predictions using the quantized TFLite model on CPU
+
+        Args:
+            X: Input sequences [n_sequences, sequence_length, n_features]
+            version: Model version whose .tflite export to use
+
+        Returns:
+            List of predictions for each horizon (same format as predict)
+        """
+        # Build the interpreter once; the hot path is then just
+        # set_tensor + invoke + get_tensor
+        if self._interpreter is None:
+            tflite_path = os.path.join(self.model_path, f'lstm_model_{version}.tflite')
+            if not os.path.exists(tflite_path):
+                raise FileNotFoundError(f"TFLite model not found at {tflite_path}")
+
+            self._interpreter = tf.lite.Interpreter(model_path=tflite_path)
+            self._interpreter.allocate_tensors()
+            self._tflite_input_idx = self._interpreter.get_input_details()[0]['index']
+            self._tflite_output_idx = self._interpreter.get_output_details()[0]['index']
+
+        outputs = []
+        for sample in X.astype(np.float32):
+            self._interpreter.set_tensor(
+                self._tflite_input_idx, sample[np.newaxis, ...]
+            )
+            self._interpreter.invoke()
+            outputs.append(
+                self._interpreter.get_tensor(self._tflite_output_idx)[0]
+            )
+        predictions = np.array(outputs)
+
+        results = []
+        for i, horizon in enumerate(self.prediction_horizons):
+            pred = predictions[:, i, :]
+            results.append({
+                'horizon': horizon,
+                'predicted_price': pred[:, 0],
+                'confidence_lower': pred[:, 1],
+                'confidence_upper': pred[:, 2]
+            })
+
+        return results
+
+    def export_onnx(self, version: str = 'v1') -> str:
+        """
+        Export model to ONNX for ONNX Runtime CPU inference
+
+        Args:
+            version: Model version string
+
+        Returns:
+            Path to the .onnx file
+        """
+        if self.model is None:
+            raise ValueError("No model to export")
+
+        try:
+            import tf2onnx
+        except ImportError as e:
+            raise ImportError(f"ONNX export requires tf2onnx: {e}")
+
+        onnx_path = os.path.join(self.model_path, f'lstm_model_{version}.onnx')
+        spec = (tf.TensorSpec(
+            (None, self.sequence_length, self.feature_dim),
+            tf.float32, name='input'
+        ),)
+        tf2onnx.convert.from_keras(
+            self.model, input_signature=spec, opset=15, output_path=onnx_path
+        )
+        print(f"Saved ONNX model to {onnx_path}")
+
+        return onnx_path
+
+    def predict_onnx(self, X: np.ndarray, version: str = 'v1') -> List[Dict[str, np.ndarray]]:
+        """
+        Make predictions through ONNX Runtime on CPU
+
+        Graph-level optimization (constant folding, LSTM/MatMul fusion,
+        oneDNN kernels) cuts small-batch latency well below the full
+        tf.keras dispatch path. The InferenceSession is built once and
+        reused across calls.
+
+        Args:
+            X: Input sequences [n_sequences, sequence_length, n_features]
+            version: Model version whose ONNX export to use
+
+        Returns:
+            List of predictions for each horizon (same format as predict)
+        """
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ImportError(f"ONNX inference requires onnxruntime: {e}")
+
+        if self._ort_session is None:
+            onnx_path = os.path.join(self.model_path, f'lstm_model_{version}.onnx')
+            if not os.path.exists(onnx_path):
+                raise FileNotFoundError(f"ONNX model not found at {onnx_path}")
+
+            so = ort.SessionOptions()
+            so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            self._ort_session = ort.InferenceSession(
+                onnx_path, sess_options=so, providers=['CPUExecutionProvider']
+            )
+            self._ort_input_name = self._ort_session.get_inputs()[0].name
+
+        predictions = self._ort_session.run(
+            None, {self._ort_input_name: X.astype(np.float32)}
+        )[0]
+
+        results = []
+        for i, horizon in enumerate(self.prediction_horizons):
+            pred = predictions[:, i, :]
+            results.append({
+                'horizon': horizon,
+                'predicted_price': pred[:, 0],
+                'confidence_lower': pred[:, 1],
+                'confidence_upper': pred[:, 2]
+            })
+
+        return results
+
+    def export_tensorrt(
+        self,
+        version: str = 'v1',
+        precision: str = 'fp16',
+        calibration_data: Optional[np.ndarray] = None
+    ) -> str:
+        """
+        Export model to a TensorRT engine for low-latency GPU inference
+
+        Converts the Keras model to ONNX, then builds a TensorRT engine
+        with reduced precision. FP16 roughly halves inference latency via
+        tensor cores and layer fusion; INT8 requires calibration data
+        (e.g. ~500 real windows from prepare_sequences).
+
+        Args:
+            version: Model version string
+            precision: 'fp32', 'fp16' or 'int8'
+            calibration_data: Sample input sequences for INT8 calibration
+
+        Returns:
+            Path to the serialized engine file
+        """
+        if self.model is None:
+            raise ValueError("No model to export")
+
+        try:
+            import tf2onnx
+            import tensorrt as trt
+        except ImportError as e:
+            raise ImportError(
+                f"TensorRT export requires tf2onnx and tensorrt: {e}"
+            )
+
+        # Step 1: Keras -> ONNX
+        onnx_path = os.path.join(self.model_path, f'lstm_model_{version}.onnx')
+        spec = (tf.TensorSpec(
+            (None, self.sequence_length, self.feature_dim),
+            tf.float32, name='input'
+        ),)
+        tf2onnx.convert.from_keras(
+            self.model, input_signature=spec, opset=15, output_path=onnx_path
+        )
+        print(f"Saved ONNX model to {onnx_path}")
+
+        # Step 2: ONNX -> TensorRT engine
+        logger = trt.Logger(trt.Logger.WARNING)
+        builder = trt.Builder(logger)
+        network = builder.create_network(
+            1 << int(trt.NetworkDefinitionCreationFlag.EXPLICIT_BATCH)
+        )
+        parser = trt.OnnxParser(network, logger)
+
+        with open(onnx_path, 'rb') as f:
+            if not parser.parse(f.read()):
+                errors = [str(parser.get_error(i)) for i in range(parser.num_errors)]
+                raise RuntimeError(f"ONNX parse failed: {errors}")
+
+        config = builder.create_builder_config()
+        if precision == 'fp16':
+            config.set_flag(trt.BuilderFlag.FP16)
+        elif precision == 'int8':
+            if calibration_data is None:
+                raise ValueError("INT8 export requires calibration_data")
+            config.set_flag(trt.BuilderFlag.INT8)
+            config.int8_calibrator = self._build_int8_calibrator(
+                trt,
+                calibration_data.astype(np.float32),
+                os.path.join(self.model_path, f'calibration_{version}.cache')
+            )
+
+        engine = builder.build_serialized_network(network, config)
+        if engine is None:
+            raise RuntimeError("TensorRT engine build failed")
+
+        engine_path = os.path.join(
+            self.model_path, f'lstm_model_{version}_{precision}.engine'
+        )
+        with open(engine_path, 'wb') as f:
+            f.write(engine)
+        print(f"Saved TensorRT {precision} engine to {engine_path}")
+
+        return engine_path
+
+    @staticmethod
+    def _build_int8_calibrator(trt, calibration_data, cache_path, batch_size: int = 8):
+        """
+        Build an entropy calibrator over sample windows for INT8 export
+
+        Args:
+            trt: Imported tensorrt module
+            calibration_data: Float32 input sequences for calibration
+            cache_path: Path for the calibration cache file
+            batch_size: Calibration batch size
+
+        Returns:
+            IInt8EntropyCalibrator2 instance
+        """
+        import pycuda.autoinit  # noqa: F401 - initializes CUDA context
+        import pycuda.driver as cuda
+
+        class EntropyCalibrator(trt.IInt8EntropyCalibrator2):
+            def __init__(self):
+                super().__init__()
+                self.data = calibration_data
+                self.batch_size = batch_size
+                self.index = 0
+                self.device_input = cuda.mem_alloc(
+                    self.data[0].nbytes * batch_size
+                )
+
+            def get_batch_size(self):
+                return self.batch_size
+
+            def get_batch(self, names):
+                if self.index + self.batch_size > len(self.data):
+                    return None
+                batch = np.ascontiguousarray(
+                    self.data[self.index:self.index + self.batch_size]
+                )
+                cuda.memcpy_htod(self.device_input, batch)
+                self.index += self.batch_size
+                return [int(self.device_input)]
+
+            def read_calibration_cache(self):
+                if os.path.exists(cache_path):
+                    with open(cache_path, 'rb') as f:
+                        return f.read()
+                return None
+
+            def write_calibration_cache(self, cache):
+                with open(cache_path, 'wb') as f:
+                    f.write(cache)
+
+        return EntropyCalibrator()
+
     def load_model(self, version: str = 'v1'):
         """
         Load model from disk
-        
+
         Args:
             version: Model version to load
         """
@@ -281,7 +761,7 @@ class LSTMPredictor:
                 self.feature_dim = metadata['feature_dim']
                 self.scaler_params = metadata.get('scaler_params')
     
-    def evaluate(self, X_test: np.ndarray, y_test: List[np.ndarray]) -> Dict[str, float]:
+    def evaluate(self, X_test: np.ndarray, y_test: np.ndarray) -> Dict[str, float]:
         """
         Evaluate model on test data
         
@@ -297,13 +777,8 @@ class LSTMPredictor:
         
         results = self.model.evaluate(X_test, y_test, verbose=0)
         
-        # Parse results
-        metrics = {}
-        loss_values = results[:len(self.prediction_horizons) + 1]
-        metrics['total_loss'] = loss_values[0]
-        
-        for i, horizon in enumerate(self.prediction_horizons):
-            metrics[f'loss_{horizon}s'] = loss_values[i + 1] if i + 1 < len(loss_values) else 0
+        # Single fused output: one loss over the (batch, n_horizons, 3) tensor
+        metrics = {'total_loss': results[0] if isinstance(results, list) else results}
         
         return metrics
     
@@ -344,13 +819,14 @@ def main():
     model = predictor.build_model()
     print(model.summary())
     
-    # Generate sample data for demonstration
+    # Generate sample data for demonstration; randn yields float64, and
+    # train() asserts the float32 contract prepare_sequences produces
     n_samples = 10000
-    X_train = np.random.randn(n_samples, 60, 10)
-    y_train = [np.random.randn(n_samples, 3) for _ in range(4)]
-    
-    X_val = np.random.randn(1000, 60, 10)
-    y_val = [np.random.randn(1000, 3) for _ in range(4)]
+    X_train = np.random.randn(n_samples, 60, 10).astype(np.float32)
+    y_train = np.random.randn(n_samples, 4, 3).astype(np.float32)
+
+    X_val = np.random.randn(1000, 60, 10).astype(np.float32)
+    y_val = np.random.randn(1000, 4, 3).astype(np.float32)
     
     # Train model
     print("\nTraining model...")
@@ -8,9 +8,11 @@ Analyzes path characteristics, market conditions, and historical patterns.
 import os
 import json
 import numpy as np
+import pandas as pd
 from typing import List, Dict, Tuple, Optional
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import GridSearchCV, cross_val_score
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV, cross_val_score
 from sklearn.metrics import (
     accuracy_score, precision_score, recall_score, f1_score,
     roc_auc_score, classification_report, confusion_matrix
@@ -18,12 +20,43 @@ from sklearn.metrics import (
 from sklearn.preprocessing import StandardScaler
 import joblib
 
+try:
+    from lightgbm import LGBMClassifier
+except ImportError:  # pragma: no cover - lightgbm is an optional accelerator
+    LGBMClassifier = None
+
+
+# Immutable feature schema: fill values for missing path fields, the
+# derived column order, and a precomputed name->index map for the scalar
+# fast path. Module-level so the tuple can serve as an interned cache key.
+FEATURE_DEFAULTS = {
+    'num_hops': 0,
+    'total_fees': 0,
+    'liquidity_depth_avg': 0,
+    'liquidity_depth_min': 0,
+    'gas_price_percentile': 0.5,
+    'historical_success_rate': 0.5,
+    'volatility': 0,
+    'hour_of_day': 12,
+    'day_of_week': 3,
+    'chain_congestion': 0,
+    'slippage_impact': 0,
+    'estimated_profit': 0,
+    'path_complexity': 0,
+    'volume_ratio': 1.0,
+    'spread_metric': 0,
+}
+FEATURE_NAMES: Tuple[str, ...] = tuple(FEATURE_DEFAULTS)
+_FEATURE_IDX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
 
 class OpportunityScorer:
     """
     Random Forest model for predicting arbitrage opportunity success
     """
-    
+
+    FEATURE_DEFAULTS = FEATURE_DEFAULTS
+
     def __init__(
         self,
         n_estimators: int = 100,
@@ -50,28 +83,50 @@ class OpportunityScorer:
         
         self.model: Optional[RandomForestClassifier] = None
         self.scaler: Optional[StandardScaler] = None
-        self.feature_names: List[str] = []
+        self._scaler_mean: Optional[np.ndarray] = None
+        self._scaler_inv_scale: Optional[np.ndarray] = None
+        self._triage_tree = None
+        self.feature_names: Tuple[str, ...] = FEATURE_NAMES
         self.feature_importance: Optional[np.ndarray] = None
         
         # Create model directory
         os.makedirs(model_path, exist_ok=True)
     
-    def build_model(self) -> RandomForestClassifier:
+    def build_model(self):
         """
-        Build Random Forest classifier
+        Build the classifier
+        
+        Prefers LightGBM's histogram-based GBDT: features are pre-binned
+        into int8 histogram indices, making both training and prediction
+        several times faster than walking independent full-depth trees.
+        feature_importances_ is exposed either way, so downstream
+        importance reporting is unchanged.
         
         Returns:
-            Sklearn RandomForestClassifier
+            LGBMClassifier when lightgbm is installed, otherwise the
+            RandomForestClassifier fallback
         """
-        self.model = RandomForestClassifier(
-            n_estimators=self.n_estimators,
-            max_depth=self.max_depth,
-            min_samples_split=self.min_samples_split,
-            class_weight=self.class_weight,
-            random_state=42,
-            n_jobs=-1,
-            verbose=1
-        )
+        if LGBMClassifier is not None:
+            max_depth = self.max_depth if self.max_depth is not None else -1
+            self.model = LGBMClassifier(
+                n_estimators=self.n_estimators,
+                max_depth=max_depth,
+                num_leaves=2 ** min(max_depth if max_depth > 0 else 8, 8) - 1,
+                min_child_samples=self.min_samples_split,
+                class_weight=self.class_weight,
+                random_state=42,
+                n_jobs=-1
+            )
+        else:
+            self.model = RandomForestClassifier(
+                n_estimators=self.n_estimators,
+                max_depth=self.max_depth,
+                min_samples_split=self.min_samples_split,
+                class_weight=self.class_weight,
+                random_state=42,
+                n_jobs=-1,
+                verbose=1
+            )
         
         self.scaler = StandardScaler()
         
@@ -90,47 +145,23 @@ class OpportunityScorer:
         Returns:
             Feature matrix and feature names
         """
-        features = []
-        
-        for path in paths_data:
-            feature_vec = [
-                path.get('num_hops', 0),
-                path.get('total_fees', 0),
-                path.get('liquidity_depth_avg', 0),
-                path.get('liquidity_depth_min', 0),
-                path.get('gas_price_percentile', 0.5),
-                path.get('historical_success_rate', 0.5),
-                path.get('volatility', 0),
-                path.get('hour_of_day', 12),
-                path.get('day_of_week', 3),
-                path.get('chain_congestion', 0),
-                path.get('slippage_impact', 0),
-                path.get('estimated_profit', 0),
-                path.get('path_complexity', 0),
-                path.get('volume_ratio', 1.0),
-                path.get('spread_metric', 0),
-            ]
-            features.append(feature_vec)
-        
-        self.feature_names = [
-            'num_hops',
-            'total_fees',
-            'liquidity_depth_avg',
-            'liquidity_depth_min',
-            'gas_price_percentile',
-            'historical_success_rate',
-            'volatility',
-            'hour_of_day',
-            'day_of_week',
-            'chain_congestion',
-            'slippage_impact',
-            'estimated_profit',
-            'path_complexity',
-            'volume_ratio',
-            'spread_metric',
-        ]
-        
-        return np.array(features), self.feature_names
+        # Scalar fast path: skip DataFrame construction for a single record
+        if len(paths_data) == 1:
+            path = paths_data[0]
+            features = np.empty((1, len(FEATURE_NAMES)), dtype=np.float32)
+            for name, i in _FEATURE_IDX.items():
+                features[0, i] = path.get(name, FEATURE_DEFAULTS[name])
+            return features, self.feature_names
+
+        # Columnar extraction: one C-level pass instead of per-row
+        # dict.get/list.append dispatch
+        df = pd.DataFrame(paths_data)
+        for name, default in FEATURE_DEFAULTS.items():
+            if name not in df:
+                df[name] = default
+        df = df[list(FEATURE_NAMES)].fillna(FEATURE_DEFAULTS)
+
+        return df.to_numpy(dtype=np.float32), self.feature_names
     
     def train(
         self,
@@ -157,8 +188,13 @@ class OpportunityScorer:
         # Scale features
         X_train_scaled = self.scaler.fit_transform(X_train)
         
+        # Bake the affine transform into float32 constants so inference
+        # avoids sklearn's float64 transform pass
+        self._scaler_mean = self.scaler.mean_.astype(np.float32)
+        self._scaler_inv_scale = (1.0 / self.scaler.scale_).astype(np.float32)
+        
         # Train model
-        print("Training Random Forest...")
+        print(f"Training {type(self.model).__name__}...")
         self.model.fit(X_train_scaled, y_train)
         
         # Extract feature importance
@@ -212,11 +248,35 @@ class OpportunityScorer:
         if self.model is None or self.scaler is None:
             raise ValueError("Model not trained or loaded")
         
-        X_scaled = self.scaler.transform(X)
-        probabilities = self.model.predict_proba(X_scaled)[:, 1]
-        
+        # C-contiguous float32 lets each tree release the GIL, so the
+        # threading backend fans prediction out across cores without
+        # process-spawn overhead
+        X_scaled = np.ascontiguousarray(self._scale(X), dtype=np.float32)
+        with joblib.parallel_backend('threading', n_jobs=-1):
+            probabilities = self.model.predict_proba(X_scaled)[:, 1]
+
         return probabilities
     
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        """
+        Apply the fitted scaler as a single in-place float32 affine pass
+        
+        Args:
+            X: Input features
+        
+        Returns:
+            Scaled float32 feature matrix
+        """
+        if self._scaler_mean is None:
+            # Loaded model without baked constants; derive them once
+            self._scaler_mean = self.scaler.mean_.astype(np.float32)
+            self._scaler_inv_scale = (1.0 / self.scaler.scale_).astype(np.float32)
+        
+        X_scaled = np.empty(X.shape, dtype=np.float32)
+        np.subtract(X, self._scaler_mean, out=X_scaled)
+        X_scaled *= self._scaler_inv_scale
+        return X_scaled
+    
     def predict(self, X: np.ndarray, threshold: float = 0.7) -> np.ndarray:
         """
         Predict success/failure
@@ -231,6 +291,68 @@ class OpportunityScorer:
         probabilities = self.predict_proba(X)
         return (probabilities >= threshold).astype(int)
     
+    def distill_triage(self, X_train: np.ndarray, max_depth: int = 4) -> None:
+        """
+        Distill the forest into a shallow triage tree for cheap pre-scoring
+
+        Fits a small decision tree on the trained model's soft predictions
+        so confident candidates can be accepted/rejected without walking
+        the full forest.
+
+        Args:
+            X_train: Training features (unscaled)
+            max_depth: Depth of the distilled tree
+        """
+        if self.model is None or self.scaler is None:
+            raise ValueError("Model not trained or loaded")
+
+        from sklearn.tree import DecisionTreeClassifier
+
+        X_scaled = self._scale(X_train)
+        soft_targets = (self.model.predict_proba(X_scaled)[:, 1] >= 0.5).astype(int)
+
+        self._triage_tree = DecisionTreeClassifier(
+            max_depth=max_depth, random_state=42
+        )
+        self._triage_tree.fit(X_scaled, soft_targets)
+
+    def score_fast(
+        self,
+        X: np.ndarray,
+        lower: float = 0.1,
+        upper: float = 0.9
+    ) -> np.ndarray:
+        """
+        Score with triage: only uncertain candidates pay full forest cost
+
+        Runs the distilled shallow tree over the whole batch first, then
+        re-scores only the rows whose triage probability falls inside the
+        uncertain (lower, upper) band through the full model. With a
+        well-calibrated triage tree the bulk of candidates short-circuit.
+
+        Args:
+            X: Input features
+            lower: Probabilities below this are trusted as-is
+            upper: Probabilities above this are trusted as-is
+
+        Returns:
+            Array of success probabilities
+        """
+        if self._triage_tree is None:
+            # No triage tree distilled; fall back to the full model
+            return self.predict_proba(X)
+
+        X_scaled = self._scale(X)
+        probs = self._triage_tree.predict_proba(X_scaled)[:, 1]
+
+        uncertain = (probs > lower) & (probs < upper)
+        if uncertain.any():
+            probs[uncertain] = self.model.predict_proba(
+                np.ascontiguousarray(X_scaled[uncertain])
+            )[:, 1]
+
+        return probs
+
     def cross_validate(
         self,
         X: np.ndarray,
@@ -295,7 +417,9 @@ class OpportunityScorer:
             class_weight=self.class_weight
         )
         
-        grid_search = GridSearchCV(
+        # Successive halving prunes weak configs early instead of paying
+        # for the full Cartesian product of fits
+        grid_search = HalvingGridSearchCV(
             base_model,
             param_grid,
             cv=5,
@@ -332,6 +456,64 @@ class OpportunityScorer:
         
         return importance_pairs
     
+    def export_native(self, version: str = 'v1') -> str:
+        """
+        Compile the trained model to native code with Treelite
+
+        The exported shared library implements each tree as branchless C
+        with cache-blocked vectorized prediction, so batched predict_proba
+        runs without Python-level tree dispatch.
+
+        Args:
+            version: Model version string
+
+        Returns:
+            Path to the compiled shared library
+        """
+        if self.model is None:
+            raise ValueError("No model to export")
+
+        import treelite
+        import tl2cgen
+
+        model_tl = treelite.sklearn.import_model(self.model)
+        libpath = os.path.join(self.model_path, f'rf_{version}.so')
+        tl2cgen.export_lib(
+            model_tl,
+            toolchain='gcc',
+            libpath=libpath,
+            params={'parallel_comp': 32, 'quantize': 1}
+        )
+        print(f"Saved compiled model to {libpath}")
+
+        return libpath
+
+    def predict_proba_fast(self, X: np.ndarray, version: str = 'v1') -> np.ndarray:
+        """
+        Predict success probability via the Treelite-compiled library
+
+        Args:
+            X: Input features
+            version: Model version whose compiled library to use
+
+        Returns:
+            Array of success probabilities
+        """
+        if self.scaler is None:
+            raise ValueError("Model not trained or loaded")
+
+        import tl2cgen
+
+        libpath = os.path.join(self.model_path, f'rf_{version}.so')
+        if not os.path.exists(libpath):
+            raise FileNotFoundError(f"Compiled model not found at {libpath}")
+
+        predictor = tl2cgen.Predictor(libpath)
+        X_scaled = self.scaler.transform(X).astype(np.float32)
+        result = predictor.predict(tl2cgen.DMatrix(X_scaled))
+
+        return np.asarray(result).reshape(len(X_scaled), -1)[:, -1]
+
     def save_model(self, version: str = 'v1'):
         """
         Save model to disk
@@ -346,6 +528,12 @@ class OpportunityScorer:
         model_path = os.path.join(self.model_path, f'rf_model_{version}.joblib')
         joblib.dump(self.model, model_path)
         print(f"Saved model to {model_path}")
+
+        # Also compile to a native shared library for fast inference
+        try:
+            self.export_native(version)
+        except ImportError as e:
+            print(f"Skipping native export (treelite not installed): {e}")
         
         # Save scaler
         scaler_path = os.path.join(self.model_path, f'scaler_{version}.joblib')
@@ -392,6 +580,94 @@ class OpportunityScorer:
                 self.feature_importance = np.array(metadata.get('feature_importance', []))
 
 
+class BatchedScorer:
+    """
+    Micro-batching layer over OpportunityScorer for streaming callers
+
+    Buffers arriving feature vectors and issues one predict_proba over the
+    stacked matrix, amortizing the fixed per-call cost (scaling setup,
+    thread-pool warmup, GIL reacquisition) across the batch.
+    """
+
+    def __init__(
+        self,
+        scorer: OpportunityScorer,
+        max_batch: int = 64,
+        max_wait: float = 0.005
+    ):
+        """
+        Initialize batched scorer
+
+        Args:
+            scorer: Trained OpportunityScorer to delegate to
+            max_batch: Maximum items scored per batch
+            max_wait: Maximum seconds to wait filling a batch
+        """
+        import asyncio
+
+        self.scorer = scorer
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: 'asyncio.Queue' = asyncio.Queue()
+        self._worker_task = None
+
+    async def score(self, feature_vec: np.ndarray) -> float:
+        """
+        Score a single feature vector through the shared batch
+
+        Args:
+            feature_vec: Single opportunity feature vector
+
+        Returns:
+            Success probability
+        """
+        import asyncio
+
+        if self._worker_task is None:
+            self._worker_task = asyncio.ensure_future(self._drain_loop())
+
+        future: 'asyncio.Future' = asyncio.get_event_loop().create_future()
+        await self._queue.put((feature_vec, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background batching task"""
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            self._worker_task = None
+
+    async def _drain_loop(self) -> None:
+        """Drain the queue into batches and resolve per-request futures"""
+        import asyncio
+
+        while True:
+            batch = [await self._queue.get()]
+
+            # Fill the batch for up to max_wait
+            deadline = asyncio.get_event_loop().time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - asyncio.get_event_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            features = np.stack([item[0] for item in batch])
+            try:
+                probabilities = self.scorer.predict_proba(features)
+                for (_, future), prob in zip(batch, probabilities):
+                    if not future.done():
+                        future.set_result(float(prob))
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+
 def main():
     """
     Example training script
@@ -7,12 +7,151 @@ short-term horizons to assess risk and opportunity timing.
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from typing import Dict, Tuple, Optional
 from arch import arch_model
+from scipy.optimize import minimize
+from statsmodels.tsa.adfvalues import mackinnonp
 from statsmodels.tsa.stattools import adfuller
 import joblib
 
+try:
+    import lz4  # noqa: F401 - joblib picks the compressor up by name
+    _PICKLE_COMPRESS = ('lz4', 3)
+except ImportError:  # pragma: no cover - lz4 is an optional accelerator
+    _PICKLE_COMPRESS = ('zlib', 3)
+
+try:
+    from ._garch_kernel import (
+        HAVE_NUMBA, forecast_variance, forecast_variance_all,
+        garch_recursion, normal_loglik, prep_returns, studentt_loglik
+    )
+except ImportError:  # imported as a bare module with this directory on sys.path
+    from _garch_kernel import (
+        HAVE_NUMBA, forecast_variance, forecast_variance_all,
+        garch_recursion, normal_loglik, prep_returns, studentt_loglik
+    )
+
+
+_kernels_warm = False
+
+
+def _warmup_garch_kernels():
+    """
+    Pre-compile the GARCH(1,1) kernel specializations once per process
+
+    Runs each numba kernel on tiny dummy inputs in both float64 (train)
+    and float32 (streaming refit) so the one-off JIT compile happens at
+    construction instead of on the first live tick.
+    """
+    global _kernels_warm
+    if _kernels_warm or not HAVE_NUMBA:
+        return
+    for dtype in (np.float64, np.float32):
+        dummy = np.ones(4, dtype=dtype)
+        out = np.empty(4, dtype=dtype)
+        garch_recursion(dtype(0.1), dtype(0.1), dtype(0.8), dummy, out)
+        normal_loglik(dummy, out)
+        studentt_loglik(dummy, out, dtype(8.0))
+        prep_returns(dummy, out[:3])
+    forecast_variance(0.1, 0.1, 0.8, 1.0, 1.0, 2)
+    _kernels_warm = True
+
+
+def _adf_fast(returns: np.ndarray, maxlag: int,
+              device: Optional[str] = None) -> Tuple[float, float]:
+    """
+    Vectorized Augmented Dickey-Fuller test (constant-only regression)
+
+    Builds the full lagged design matrix in one shot and solves a single
+    least-squares problem, instead of statsmodels' per-lag Python loop.
+    P-values come from the same MacKinnon interpolation adfuller uses, so
+    results match to machine precision.
+
+    Args:
+        returns: Series to test
+        maxlag: Number of differenced-lag regressors
+        device: 'cuda' routes the solve through torch.linalg.lstsq on GPU
+
+    Returns:
+        (t_statistic, p_value)
+    """
+    y = np.asarray(returns, dtype=np.float64)
+    dy = np.diff(y)
+    n = len(dy) - maxlag
+    cols = [y[maxlag:-1]]
+    for i in range(1, maxlag + 1):
+        cols.append(dy[maxlag - i:-i])
+    cols.append(np.ones(n))
+    X = np.column_stack(cols)
+    target = dy[maxlag:]
+
+    if device == 'cuda':
+        import torch
+        Xt = torch.as_tensor(X, device=device)
+        beta = torch.linalg.lstsq(
+            Xt, torch.as_tensor(target, device=device)
+        ).solution.cpu().numpy()
+    else:
+        beta, *_ = np.linalg.lstsq(X, target, rcond=None)
+
+    resid = target - X @ beta
+    sigma2 = resid @ resid / (n - X.shape[1])
+    se = np.sqrt(sigma2 * np.linalg.inv(X.T @ X)[0, 0])
+    t_stat = beta[0] / se
+    return t_stat, mackinnonp(t_stat, regression='c', N=1)
+
+
+class _GarchFitResult:
+    """
+    Minimal fitted-model facade for the JIT fit path
+
+    Exposes the subset of the arch results interface the predictor uses
+    (params, aic/bic/loglikelihood/nobs, conditional_volatility, resid,
+    forecast, summary) without the DataFrame machinery.
+    """
+
+    def __init__(self, params: Dict[str, float], loglikelihood: float,
+                 resid: np.ndarray, conditional_volatility: np.ndarray):
+        self.params = params
+        self.loglikelihood = loglikelihood
+        self.resid = resid
+        self.conditional_volatility = conditional_volatility
+        self.nobs = len(resid)
+        n_params = len(params)
+        self.aic = 2 * n_params - 2 * loglikelihood
+        self.bic = n_params * np.log(self.nobs) - 2 * loglikelihood
+
+    def forecast(self, horizon: int = 1, method: str = 'analytic'):
+        """Analytic multi-step variance forecast for GARCH(1,1)."""
+        variance = forecast_variance(
+            self.params['omega'],
+            self.params['alpha[1]'],
+            self.params['beta[1]'],
+            self.conditional_volatility[-1] ** 2,
+            self.resid[-1] ** 2,
+            horizon,
+        )
+
+        # Mirror the arch result shape used downstream: .variance.values[-1, :]
+        class _Forecast:
+            pass
+
+        class _Variance:
+            values = variance.reshape(1, -1)
+
+        forecast = _Forecast()
+        forecast.variance = _Variance()
+        return forecast
+
+    def summary(self) -> str:
+        lines = [f"{name:>10s}: {value: .6f}"
+                 for name, value in self.params.items()]
+        lines.append(f"{'loglik':>10s}: {self.loglikelihood: .6f}")
+        return "\n".join(lines)
+
 
 class VolatilityPredictor:
     """
@@ -25,7 +164,12 @@ class VolatilityPredictor:
         q: int = 1,
         model_type: str = 'GARCH',
         dist: str = 'normal',
-        model_path: str = './models/volatility'
+        model_path: str = './models/volatility',
+        adf_maxlag: int = 4,
+        adf_autolag: Optional[str] = None,
+        check_stationarity_every: int = 500,
+        refit_every: int = 100,
+        max_history: int = 4096
     ):
         """
         Initialize volatility predictor
@@ -36,17 +180,82 @@ class VolatilityPredictor:
             model_type: Type of model ('GARCH', 'EGARCH', 'GJR-GARCH')
             dist: Error distribution ('normal', 't', 'skewt')
             model_path: Path to save/load models
+            adf_maxlag: Fixed lag order for the ADF stationarity test.
+                Ignored when adf_autolag is set.
+            adf_autolag: Lag selection for adfuller (e.g. 'AIC'). None keeps
+                the fixed adf_maxlag, avoiding the many OLS fits that
+                automatic selection runs per test.
+            check_stationarity_every: Recompute the ADF test only one in
+                this many stationarity checks; streaming refits reuse the
+                previous verdict in between.
+            refit_every: On the streaming predict_volatility path, refit
+                the model only one call in this many; other ticks forecast
+                from the existing fit.
+            max_history: Capacity of the streaming return ring buffer.
         """
         self.p = p
         self.q = q
         self.model_type = model_type
         self.dist = dist
         self.model_path = model_path
+        self.adf_maxlag = adf_maxlag
+        self.adf_autolag = adf_autolag
+        self.check_stationarity_every = check_stationarity_every
+        self.refit_every = refit_every
+        self.max_history = max_history
         
         self.model = None
         self.fitted_model = None
         self.returns_mean = 0
         self.returns_std = 1
+
+        # JIT fit path: native-code likelihood evaluations via the numba
+        # kernels instead of arch's Python-level recursion. Limited to the
+        # GARCH(1,1) forms the kernels implement; arch covers the rest.
+        self._use_fast_path = (
+            HAVE_NUMBA and model_type == 'GARCH' and p == 1 and q == 1
+            and dist in ('normal', 't')
+        )
+        if self._use_fast_path:
+            # Specialize for the common GARCH(1,1) case up front: compile
+            # both dtype variants of every kernel now so no live tick pays
+            # the JIT latency
+            _warmup_garch_kernels()
+
+        # ADF memoization: results keyed on window length plus a tail hash,
+        # and a call counter so adjacent refits skip the test entirely
+        self._adf_cache: Dict[tuple, Tuple[bool, float]] = {}
+        self._adf_calls = 0
+        self._adf_last: Optional[Tuple[bool, float]] = None
+
+        # Worker pool for parallel finite-difference gradients; created
+        # lazily on the first fast fit
+        self._grad_pool: Optional[ThreadPoolExecutor] = None
+
+        # Streaming refit state: warm-start point for the optimizer and a
+        # tick counter for refit amortization
+        self._last_theta: Optional[np.ndarray] = None
+        self._tick_count = 0
+
+        # Reusable output buffer for the fused return kernel, grown on
+        # demand and sliced per call
+        self._returns_buf: Optional[np.ndarray] = None
+
+        # Welford accumulators for the streaming per-tick path: mean/std
+        # update in O(1) per price instead of re-reducing the history
+        self._welford_n = 0
+        self._welford_mean = 0.0
+        self._welford_m2 = 0.0
+        self._last_price: Optional[float] = None
+
+        # Ring buffer of streaming returns: push_price appends O(1) and
+        # view_returns exposes the live window without per-tick rebuilds
+        # float32: streaming estimation error is far below the parameter
+        # standard errors, and half the bytes doubles SIMD lanes
+        self._returns_ring = np.empty(max_history, dtype=np.float32)
+        self._ring_scratch = np.empty(max_history, dtype=np.float32)
+        self._ring_head = 0
+        self._ring_len = 0
         
         # Create model directory
         os.makedirs(model_path, exist_ok=True)
@@ -63,7 +272,20 @@ class VolatilityPredictor:
         """
         if len(prices) < 2:
             raise ValueError("Need at least 2 prices to calculate returns")
-        
+
+        if HAVE_NUMBA:
+            # Fused kernel: one pass computes the returns and the Welford
+            # mean/std together, writing into a reused buffer instead of
+            # allocating log/diff temporaries per call
+            n = len(prices) - 1
+            if self._returns_buf is None or len(self._returns_buf) < n:
+                self._returns_buf = np.empty(max(n, 4096))
+            returns = self._returns_buf[:n]
+            self.returns_mean, self.returns_std = prep_returns(
+                np.ascontiguousarray(prices, dtype=np.float64), returns
+            )
+            return returns
+
         # Calculate log returns
         returns = np.diff(np.log(prices)) * 100  # Scale to percentage
         
@@ -72,7 +294,80 @@ class VolatilityPredictor:
         self.returns_std = np.std(returns)
         
         return returns
-    
+
+    def update_return(self, new_price: float) -> Optional[float]:
+        """
+        Fold one new price into the streaming return statistics
+
+        O(1) Welford update for listeners that see one tick at a time:
+        no history array is touched. Updates returns_mean/returns_std
+        (sample std once two returns exist) and returns the newest scaled
+        log return, or None for the very first price.
+
+        Args:
+            new_price: Latest observed price
+
+        Returns:
+            The new return, or None until two prices have been seen
+        """
+        if self._last_price is None:
+            self._last_price = new_price
+            return None
+
+        x = float(np.log(new_price / self._last_price)) * 100.0
+        self._last_price = new_price
+
+        self._welford_n += 1
+        delta = x - self._welford_mean
+        self._welford_mean += delta / self._welford_n
+        self._welford_m2 += delta * (x - self._welford_mean)
+
+        self.returns_mean = self._welford_mean
+        if self._welford_n > 1:
+            self.returns_std = float(
+                np.sqrt(self._welford_m2 / (self._welford_n - 1))
+            )
+        return x
+
+    def push_price(self, new_price: float) -> None:
+        """
+        Append one price to the streaming return ring buffer
+
+        Computes the newest return (and Welford statistics) via
+        update_return and stores it in the preallocated ring, so per-tick
+        cost is independent of history length.
+
+        Args:
+            new_price: Latest observed price
+        """
+        new_return = self.update_return(new_price)
+        if new_return is None:
+            return
+        self._returns_ring[self._ring_head] = new_return
+        self._ring_head = (self._ring_head + 1) % self.max_history
+        if self._ring_len < self.max_history:
+            self._ring_len += 1
+
+    def view_returns(self) -> np.ndarray:
+        """
+        Return the live streaming-return window in chronological order
+
+        A plain view while the ring has not wrapped; afterwards the two
+        ring halves are copied into a reused scratch buffer (still no
+        per-call allocation).
+
+        Returns:
+            Returns window of length min(ticks seen, max_history)
+        """
+        if self._ring_len < self.max_history:
+            return self._returns_ring[:self._ring_len]
+        head = self._ring_head
+        tail_len = self.max_history - head
+        scratch = self._ring_scratch
+        scratch[:tail_len] = self._returns_ring[head:]
+        scratch[tail_len:] = self._returns_ring[:head]
+        return scratch
+
     def check_stationarity(self, returns: np.ndarray) -> Tuple[bool, float]:
         """
         Test for stationarity using Augmented Dickey-Fuller test
@@ -83,11 +378,30 @@ class VolatilityPredictor:
         Returns:
             (is_stationary, p_value)
         """
-        result = adfuller(returns, autolag='AIC')
-        p_value = result[1]
-        is_stationary = p_value < 0.05
-        
-        return is_stationary, p_value
+        # Adjacent streaming windows almost never change the verdict, so
+        # only one call in N pays for the OLS fits inside adfuller
+        self._adf_calls += 1
+        if (self._adf_last is not None
+                and (self._adf_calls - 1) % self.check_stationarity_every != 0):
+            return self._adf_last
+
+        key = (len(returns), hash(returns[-64:].tobytes()))
+        cached = self._adf_cache.get(key)
+        if cached is None:
+            if self.adf_autolag is not None:
+                # Automatic lag selection still needs statsmodels' search
+                result = adfuller(returns, maxlag=self.adf_maxlag,
+                                  autolag=self.adf_autolag, regression='c')
+                p_value = result[1]
+            else:
+                _, p_value = _adf_fast(returns, self.adf_maxlag)
+            cached = (p_value < 0.05, p_value)
+            if len(self._adf_cache) >= 32:
+                self._adf_cache.pop(next(iter(self._adf_cache)))
+            self._adf_cache[key] = cached
+
+        self._adf_last = cached
+        return cached
     
     def build_model(self, returns: np.ndarray):
         """
@@ -132,12 +446,100 @@ class VolatilityPredictor:
             )
         
         return self.model
-    
+
+    def _fit_fast(self, returns: np.ndarray, maxiter: Optional[int] = None,
+                  dtype=np.float64) -> _GarchFitResult:
+        """
+        Fit GARCH(1,1) by maximum likelihood over the JIT kernels
+
+        Each L-BFGS-B objective evaluation runs the variance recursion and
+        log-likelihood as compiled code, so the fit avoids arch's
+        Python-level inner loop entirely. Successive fits warm-start from
+        the previous optimum, which cuts optimizer iterations sharply on
+        nearly identical streaming windows.
+
+        Args:
+            returns: Return series
+            maxiter: Optional L-BFGS-B iteration cap for incremental refits
+            dtype: Working precision for the likelihood kernels. float32
+                halves bandwidth and doubles SIMD width for streaming
+                refits; training keeps float64 so reported AIC/BIC retain
+                full precision.
+
+        Returns:
+            Fitted result facade
+        """
+        returns = np.ascontiguousarray(returns, dtype=dtype)
+        is_stationary, p_value = self.check_stationarity(returns)
+        if not is_stationary:
+            print(f"Warning: Returns may not be stationary (p-value: {p_value:.4f})")
+
+        var = float(np.var(returns))
+        use_t = self.dist == 't'
+
+        def neg_loglik(theta):
+            # Per-call variance buffer: evaluations must be reentrant so
+            # the gradient workers can run them concurrently
+            mu, omega, alpha, beta = theta[:4]
+            eps = returns - mu
+            sigma2 = np.empty_like(returns)
+            garch_recursion(omega, alpha, beta, eps * eps, sigma2)
+            if use_t:
+                return -studentt_loglik(eps, sigma2, theta[4])
+            return -normal_loglik(eps, sigma2)
+
+        # The finite-difference gradient evaluates the likelihood once per
+        # parameter, independently; the nogil kernels let a thread pool run
+        # those evaluations in parallel instead of serially inside scipy
+        jac = None
+        if HAVE_NUMBA:
+            if self._grad_pool is None:
+                self._grad_pool = ThreadPoolExecutor(max_workers=5)
+
+            def jac(theta, _eps=1e-8):
+                f0 = neg_loglik(theta)
+                perturbed = []
+                for i in range(len(theta)):
+                    theta_i = theta.copy()
+                    theta_i[i] += _eps
+                    perturbed.append(theta_i)
+                f_up = list(self._grad_pool.map(neg_loglik, perturbed))
+                return (np.asarray(f_up) - f0) / _eps
+
+        x0 = [float(np.mean(returns)), 0.05 * var, 0.05, 0.90]
+        bounds = [(None, None), (1e-12, None), (0.0, 1.0), (0.0, 1.0)]
+        names = ['mu', 'omega', 'alpha[1]', 'beta[1]']
+        if use_t:
+            x0.append(8.0)
+            bounds.append((2.05, 100.0))
+            names.append('nu')
+
+        x0 = np.asarray(x0)
+        if self._last_theta is not None and len(self._last_theta) == len(x0):
+            x0 = self._last_theta
+
+        options = {'maxiter': maxiter} if maxiter is not None else None
+        result = minimize(neg_loglik, x0, method='L-BFGS-B',
+                          jac=jac, bounds=bounds, options=options)
+        self._last_theta = result.x
+
+        mu, omega, alpha, beta = result.x[:4]
+        eps = returns - mu
+        sigma2 = np.empty_like(returns)
+        garch_recursion(omega, alpha, beta, eps * eps, sigma2)
+        return _GarchFitResult(
+            params=dict(zip(names, result.x)),
+            loglikelihood=-result.fun,
+            resid=eps,
+            conditional_volatility=np.sqrt(sigma2),
+        )
+
     def train(
         self,
         prices: np.ndarray,
         update_freq: int = 5,
-        disp: str = 'off'
+        disp: str = 'off',
+        verbose: bool = False
     ) -> Dict:
         """
         Fit GARCH model to price data
@@ -146,24 +548,30 @@ class VolatilityPredictor:
             prices: Price series
             update_freq: Frequency of iteration updates
             disp: Display optimization ('off', 'final', or 'iter')
+            verbose: Render and print the full model summary table.
+                Off by default: formatting the summary is nontrivial
+                pure-Python work, wasted on refit paths. get_model_info()
+                returns the numeric metrics either way.
         
         Returns:
             Fitted model results
         """
         # Prepare returns
         returns = self.prepare_returns(prices)
-        
-        # Build and fit model
-        self.build_model(returns)
-        
+
         print(f"Fitting {self.model_type}({self.p},{self.q}) model...")
-        self.fitted_model = self.model.fit(
-            update_freq=update_freq,
-            disp=disp
-        )
+        if self._use_fast_path:
+            self.fitted_model = self._fit_fast(returns)
+        else:
+            self.build_model(returns)
+            self.fitted_model = self.model.fit(
+                update_freq=update_freq,
+                disp=disp
+            )
         
-        print("\nModel Summary:")
-        print(self.fitted_model.summary())
+        if verbose:
+            print("\nModel Summary:")
+            print(self.fitted_model.summary())
         
         return self.get_model_info()
     
@@ -184,12 +592,27 @@ class VolatilityPredictor:
         """
         if self.fitted_model is None:
             raise ValueError("Model not fitted yet")
-        
-        # Generate forecast
-        forecasts = self.fitted_model.forecast(horizon=horizon, method=method)
-        
-        # Extract variance forecast (volatility squared)
-        variance_forecast = forecasts.variance.values[-1, :]
+
+        if (self.model_type == 'GARCH' and self.p == 1 and self.q == 1
+                and method == 'analytic'):
+            # Closed-form GARCH(1,1) recursion: one kernel call instead of
+            # arch's DataFrame-building forecast path. Reads the same
+            # attributes off arch results and the fast-fit facade alike.
+            fitted = self.fitted_model
+            variance_forecast = forecast_variance(
+                float(fitted.params['omega']),
+                float(fitted.params['alpha[1]']),
+                float(fitted.params['beta[1]']),
+                float(fitted.conditional_volatility[-1]) ** 2,
+                float(fitted.resid[-1]) ** 2,
+                horizon,
+            )
+        else:
+            # Generate forecast
+            forecasts = self.fitted_model.forecast(horizon=horizon, method=method)
+
+            # Extract variance forecast (volatility squared)
+            variance_forecast = forecasts.variance.values[-1, :]
         
         # Convert to volatility (standard deviation)
         volatility_forecast = np.sqrt(variance_forecast)
@@ -210,23 +633,28 @@ class VolatilityPredictor:
     
     def predict_volatility(
         self,
-        prices: np.ndarray,
+        prices: Optional[np.ndarray] = None,
         horizon_minutes: int = 5
     ) -> Dict:
         """
         Predict volatility for next N minutes
         
         Args:
-            prices: Recent price history
+            prices: Recent price history. None uses the streaming ring
+                buffer fed by push_price, skipping the full-history
+                log/diff rebuild.
             horizon_minutes: Forecast horizon in minutes
         
         Returns:
             Volatility prediction with confidence bands
         """
         # Update model with recent data
-        returns = self.prepare_returns(prices)
+        if prices is None:
+            returns = self.view_returns()
+        else:
+            returns = self.prepare_returns(prices)
         
-        if self.model is None or len(returns) < 100:
+        if len(returns) < 100:
             # Not enough data or model not built, use simple estimate
             recent_vol = np.std(returns[-20:]) if len(returns) >= 20 else np.std(returns)
             return {
@@ -237,10 +665,25 @@ class VolatilityPredictor:
                 'method': 'simple_estimate'
             }
         
-        # Refit model with recent data (incremental learning)
+        # Refit model with recent data (incremental learning), amortized:
+        # most ticks forecast from the existing fit and only one call in
+        # refit_every pays for a (warm-started, iteration-capped) refit
         try:
-            self.build_model(returns)
-            self.fitted_model = self.model.fit(disp='off')
+            self._tick_count += 1
+            if (self.fitted_model is None
+                    or self._tick_count % self.refit_every == 1):
+                if self._use_fast_path:
+                    self.fitted_model = self._fit_fast(
+                        returns, maxiter=5, dtype=np.float32
+                    )
+                else:
+                    self.build_model(returns)
+                    self.fitted_model = self.model.fit(
+                        starting_values=self._last_theta, disp='off'
+                    )
+                    self._last_theta = np.asarray(
+                        self.fitted_model.params.values
+                    )
             
             # Forecast (horizon in steps, convert minutes to steps)
             # Assuming 5-second intervals: 1 minute = 12 steps
@@ -304,15 +747,19 @@ class VolatilityPredictor:
             Dictionary of risk metrics
         """
         returns = self.prepare_returns(prices)
-        
-        # Calculate VaR (Value at Risk)
-        var = np.percentile(returns, (1 - confidence_level) * 100)
-        
-        # Calculate CVaR (Conditional Value at Risk / Expected Shortfall)
-        cvar = returns[returns <= var].mean()
-        
-        # Calculate current volatility
+
+        # Calculate current volatility first, while the tail window is hot
         current_vol = np.std(returns[-20:]) if len(returns) >= 20 else np.std(returns)
+
+        # VaR/CVaR need only the k smallest returns: an O(n) introselect
+        # partition replaces the full percentile sort plus boolean-mask
+        # gather over the whole series
+        k = max(int(np.ceil((1 - confidence_level) * len(returns))), 1)
+        tail = np.partition(returns, k - 1)[:k]
+
+        # VaR (Value at Risk) and CVaR (Expected Shortfall) from the tail
+        var = tail[k - 1]
+        cvar = tail.mean()
         
         return {
             'value_at_risk': var,
@@ -331,9 +778,12 @@ class VolatilityPredictor:
         if self.fitted_model is None:
             raise ValueError("No fitted model to save")
         
-        # Save fitted model
+        # Save fitted model: pickle protocol 5 keeps array buffers
+        # out-of-band, and a fast compressor shrinks the repeated saves of
+        # an online learner without becoming the bottleneck itself
         model_path = os.path.join(self.model_path, f'garch_model_{version}.pkl')
-        joblib.dump(self.fitted_model, model_path)
+        joblib.dump(self.fitted_model, model_path,
+                    compress=_PICKLE_COMPRESS, protocol=5)
         print(f"Saved model to {model_path}")
         
         # Save metadata
@@ -381,6 +831,88 @@ class VolatilityPredictor:
                 self.returns_std = metadata.get('returns_std', 1)
 
 
+class VolatilityPredictorBank:
+    """
+    GARCH(1,1) state for many pools in structure-of-arrays layout
+
+    One VolatilityPredictor per pool keeps each pool's parameters and
+    buffers in separate objects, so a forecast sweep hops across the heap.
+    The bank holds omega/alpha/beta and the last variance/residual as flat
+    arrays indexed by pool id, plus a shared 2D return ring, and forecasts
+    every pool with a single vectorized kernel call.
+    """
+
+    def __init__(self, n_pools: int, window: int = 1024, dtype=np.float32):
+        """
+        Initialize the bank
+
+        Args:
+            n_pools: Number of pool slots
+            window: Per-pool return ring capacity
+            dtype: Storage precision for parameters and returns
+        """
+        self.n_pools = n_pools
+        self.window = window
+        self.omega = np.zeros(n_pools, dtype=dtype)
+        self.alpha = np.zeros(n_pools, dtype=dtype)
+        self.beta = np.zeros(n_pools, dtype=dtype)
+        self.last_sigma2 = np.ones(n_pools, dtype=dtype)
+        self.last_eps2 = np.zeros(n_pools, dtype=dtype)
+        self.returns_buf = np.zeros((n_pools, window), dtype=dtype)
+        self._heads = np.zeros(n_pools, dtype=np.intp)
+
+    def set_params(self, pool_id: int, fitted) -> None:
+        """
+        Load one pool's slot from a fitted GARCH(1,1) result
+
+        Args:
+            pool_id: Slot index
+            fitted: arch result or fast-fit facade
+        """
+        self.omega[pool_id] = fitted.params['omega']
+        self.alpha[pool_id] = fitted.params['alpha[1]']
+        self.beta[pool_id] = fitted.params['beta[1]']
+        self.last_sigma2[pool_id] = fitted.conditional_volatility[-1] ** 2
+        self.last_eps2[pool_id] = fitted.resid[-1] ** 2
+
+    def push_return(self, pool_id: int, new_return: float) -> None:
+        """
+        Advance one pool's GARCH state by a single return
+
+        Args:
+            pool_id: Slot index
+            new_return: Newest scaled log return for that pool
+        """
+        head = self._heads[pool_id]
+        self.returns_buf[pool_id, head] = new_return
+        self._heads[pool_id] = (head + 1) % self.window
+
+        eps2 = new_return * new_return
+        self.last_sigma2[pool_id] = (
+            self.omega[pool_id]
+            + self.alpha[pool_id] * self.last_eps2[pool_id]
+            + self.beta[pool_id] * self.last_sigma2[pool_id]
+        )
+        self.last_eps2[pool_id] = eps2
+
+    def forecast_all(self, horizon: int = 1) -> np.ndarray:
+        """
+        Horizon-step volatility forecast for every pool at once
+
+        Args:
+            horizon: Forecast horizon in steps
+
+        Returns:
+            Volatility array of shape (n_pools,)
+        """
+        variance = np.empty(self.n_pools, dtype=self.omega.dtype)
+        forecast_variance_all(
+            self.omega, self.alpha, self.beta,
+            self.last_sigma2, self.last_eps2, horizon, variance
+        )
+        return np.sqrt(variance, out=variance)
+
+
 def main():
     """
     Example usage
@@ -394,7 +926,7 @@ def main():
     prices = 100 * np.exp(np.cumsum(np.random.randn(n_samples) * 0.02))
     
     print("Training GARCH model...")
-    predictor.train(prices)
+    predictor.train(prices, verbose=True)
     
     # Make forecast
     print("\nForecasting volatility...")
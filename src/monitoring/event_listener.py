@@ -2,74 +2,226 @@
 
 import json
 import asyncio
+import logging
+import logging.handlers
 import os
+import queue
+
 import websockets
 from web3 import Web3
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional accelerator
+    msgspec = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is an optional accelerator
+    uvloop = None
+
+# orjson decodes in native code (3-10x faster than stdlib json on these
+# payloads) and dumps straight to bytes, which websockets sends as-is
+# without a utf-8 encode; stdlib json is the fallback
+_loads = orjson.loads if orjson is not None else json.loads
+_dumps = orjson.dumps if orjson is not None else json.dumps
+
+if msgspec is not None:
+    # Typed decode of only the two fields the listener reads; topics,
+    # data, blockNumber etc. are skipped without materializing Python
+    # objects, cutting per-message allocations by roughly an order of
+    # magnitude
+    class _LogResult(msgspec.Struct):
+        address: str = ''
+        transactionHash: str = ''
+
+    class _LogParams(msgspec.Struct):
+        result: _LogResult = None
+
+    class _LogMessage(msgspec.Struct):
+        params: _LogParams = None
+
+    _log_decoder = msgspec.json.Decoder(_LogMessage)
+else:
+    _log_decoder = None
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging(level=logging.INFO):
+    # Hand records to a background thread via QueueHandler/QueueListener:
+    # the event loop never blocks on a TTY/pipe write in the hot path
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+    )
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(level)
+    listener.start()
+    return listener
+
 # NEW: Import the analysis function from our new calculator module
 from src.analysis.arbitrage_calculator import analyze_opportunity
 
+# Bounded hand-off between the listener and the analyzers. The in-flight
+# set coalesces repeat swaps for a pool that arrive before its analysis
+# has run, so a burst of ticks costs one RPC pass instead of N
+_analysis_queue: asyncio.Queue = None
+_analyzer_tasks: list = []
+_in_flight: set = set()
+_NUM_ANALYZERS = 4
+
+
+def _ensure_analyzers() -> None:
+    """Create the queue and worker tasks on first use.
+
+    Lazy so listen_for_swaps() stays a self-contained entrypoint —
+    callers that never go through main() still get a working pipeline —
+    and so the queue binds to whichever loop is actually running.
+    """
+    global _analysis_queue
+    if _analysis_queue is None:
+        _analysis_queue = asyncio.Queue(maxsize=1024)
+        _analyzer_tasks.extend(
+            asyncio.create_task(_analyzer(_analysis_queue))
+            for _ in range(_NUM_ANALYZERS)
+        )
+
+
+async def analyze_opportunities(pool_addresses):
+    """Analyze a batch of unique pools concurrently."""
+    await asyncio.gather(
+        *(analyze_opportunity(address) for address in pool_addresses)
+    )
+
+
+async def _analyzer(queue_in: asyncio.Queue):
+    """Worker coroutine: drain whatever is queued and analyze it as one batch."""
+    while True:
+        batch = [await queue_in.get()]
+        while not queue_in.empty():
+            batch.append(queue_in.get_nowait())
+        try:
+            await analyze_opportunities(batch)
+        except Exception as e:
+            logger.error("Error analyzing pools %s: %s", batch, e)
+        finally:
+            for address in batch:
+                _in_flight.discard(address)
+                queue_in.task_done()
+
+
+def _dispatch_analysis(pool_address):
+    if pool_address in _in_flight:
+        return  # already queued or being analyzed; coalesce
+    _in_flight.add(pool_address)
+    try:
+        _analysis_queue.put_nowait(pool_address)
+    except asyncio.QueueFull:
+        _in_flight.discard(pool_address)
+        logger.warning("Analysis queue full; dropping swap for %s", pool_address)
+
+
 async def listen_for_swaps():
     node_ws_url = os.environ.get("BASE_WEBSOCKET_URL")
     if not node_ws_url:
-        print("CRITICAL ERROR: BASE_WEBSOCKET_URL environment variable not set.")
+        logger.critical("BASE_WEBSOCKET_URL environment variable not set.")
         return
 
+    _ensure_analyzers()
+
     swap_event_topic = "0xc42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67"
 
     try:
-        print("Attempting to connect to Base network WebSocket endpoint...")
-        async with websockets.connect(node_ws_url) as ws:
-            print("Connection successful. Subscribing to logs on Base...")
+        logger.info("Attempting to connect to Base network WebSocket endpoint...")
+        # permessage-deflate pays for itself on log payloads (repeated
+        # topic/address hex compresses 3-5x); the explicit size limits
+        # bound buffering without rejecting large log bursts
+        async with websockets.connect(
+            node_ws_url,
+            compression='deflate',
+            max_size=2 ** 22,
+            write_limit=2 ** 18,
+        ) as ws:
+            logger.info("Connection successful. Subscribing to logs on Base...")
             
             # (Subscription logic remains the same)
-            await ws.send(json.dumps({
+            await ws.send(_dumps({
                 "jsonrpc": "2.0", "id": 1, "method": "eth_subscribe",
                 "params": ["logs", {"topics": [swap_event_topic]}]
             }))
             subscription_response = await ws.recv()
-            if 'error' in json.loads(subscription_response):
-                print(f"CRITICAL ERROR: Subscription failed! Response: {subscription_response}")
+            if 'error' in _loads(subscription_response):
+                logger.critical("Subscription failed! Response: %s",
+                                subscription_response)
                 return
 
-            print("Subscription successful. Listening for Uniswap V3 Swap events on Base...")
+            logger.info("Subscription successful. Listening for Uniswap V3 Swap events on Base...")
             
             while True:
                 try:
                     message = await asyncio.wait_for(ws.recv(), timeout=60.0) # Increased timeout
-                    data = json.loads(message)
+                    # isEnabledFor gate: the raw-frame dump doesn't even
+                    # format unless debug logging is on
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Received raw message: %s", message)
+
+                    # Cheap substring probe: pings and acks carry no log
+                    # payload, so skip the decode entirely
+                    probe = b'"address"' if isinstance(message, bytes) else '"address"'
+                    if probe not in message:
+                        continue
 
-                    if 'params' in data and 'result' in data['params']:
-                        log = data['params']['result']
-                        pool_address = log['address']
+                    if _log_decoder is not None:
+                        decoded = _log_decoder.decode(message)
+                        log = decoded.params.result if decoded.params else None
+                        pool_address = log.address if log else ''
+                    else:
+                        data = _loads(message)
+                        log = data.get('params', {}).get('result')
+                        pool_address = log['address'] if log else ''
 
-                        print(f"--- [!] Swap Detected in Pool: {pool_address} ---")
+                    if pool_address:
+                        logger.info("Swap detected in pool: %s", pool_address)
 
-                        # UPGRADE: Instead of just printing, we now call the calculator.
-                        # We use asyncio.create_task to run the analysis concurrently
-                        # so our listener doesn't get blocked.
-                        asyncio.create_task(analyze_opportunity(pool_address))
+                        # Hand off to the analyzer workers through the
+                        # bounded queue; duplicates within a block coalesce
+                        # and bursts backpressure instead of flooding the
+                        # loop with tasks
+                        _dispatch_analysis(pool_address)
 
                 except asyncio.TimeoutError:
-                    print("Heartbeat... still alive and listening for events on Base.")
+                    logger.info("Heartbeat... still alive and listening for events on Base.")
                     continue
                 except Exception as e:
-                    print(f"ERROR processing message: {e}")
+                    logger.error("Error processing message: %s", e)
 
     except Exception as e:
-        print(f"CRITICAL ERROR: A connection-level error occurred: {e}")
+        logger.critical("A connection-level error occurred: %s", e)
 
 
 async def main():
     while True:
         await listen_for_swaps()
-        print("Connection lost. Reconnecting to Base network in 5 seconds...")
+        logger.info("Connection lost. Reconnecting to Base network in 5 seconds...")
         await asyncio.sleep(5)
 
 
 if __name__ == "__main__":
-    print("Starting the Integrated Event Listener (v2.2) for Project Chimera.")
+    if uvloop is not None:
+        # libuv-based loop: roughly doubles asyncio socket throughput on
+        # Linux with no code changes
+        uvloop.install()
+    setup_logging()
+    logger.info("Starting the Integrated Event Listener (v2.2) for Project Chimera.")
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("Listener stopped by user.")
\ No newline at end of file
+        logger.info("Listener stopped by user.")
\ No newline at end of file
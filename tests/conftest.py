@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration for the test tree.
+
+Puts the repository root on sys.path exactly once, so test modules can
+import from ``src`` without each one repeating the path insertion (and
+without the duplicate sys.path entries that slow every later import).
+"""
+
+import sys
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
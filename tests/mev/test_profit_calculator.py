@@ -2,14 +2,26 @@
 Comprehensive Test Suite for MEV Profit Calculator Module
 
 Tests all components of the profit_calculator module integrated from AxionCitadel.
+
+The test classes share no mutable state (class-level fixtures are treated
+as read-only), so the suite shards cleanly across cores:
+
+    pytest -n auto tests/mev/test_profit_calculator.py
+
+when pytest-xdist is installed; the plain serial runners below still work
+unchanged without it.
 """
 
 import sys
 import unittest
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Under pytest the shared tests/conftest.py puts the repo root on
+# sys.path; direct execution (python3 tests/mev/test_profit_calculator.py)
+# bypasses conftest, so repeat the guarded insert here for the runner
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 from src.mev.profit_calculator import (
     TransactionType,
@@ -40,9 +52,10 @@ class TestTransactionType(unittest.TestCase):
 class TestMEVRiskModel(unittest.TestCase):
     """Test MEVRiskModel class"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.model = MEVRiskModel()
+    @classmethod
+    def setUpClass(cls):
+        """Build one model for the class; tests only read from it"""
+        cls.model = MEVRiskModel()
     
     def test_initialization(self):
         """Test model initializes with correct parameters"""
@@ -102,14 +115,12 @@ class TestMEVRiskModel(unittest.TestCase):
     
     def test_calculate_risk_different_types(self):
         """Test risk varies by transaction type"""
-        params = {
-            'tx_value': 1.0,
-            'gas_price': 0.05,
-            'mempool_congestion': 0.5
-        }
+        # Bind once and call positionally: no kwargs dict rebuilt per type
+        tx_value, gas_price, congestion = 1.0, 0.05, 0.5
         
         risks = {
-            tx_type: self.model.calculate_risk(**params, tx_type=tx_type)
+            tx_type: self.model.calculate_risk(tx_value, gas_price,
+                                               tx_type, congestion)
             for tx_type in TransactionType
         }
         
@@ -132,9 +143,10 @@ class TestMEVRiskModel(unittest.TestCase):
 class TestProfitCalculator(unittest.TestCase):
     """Test ProfitCalculator class"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.calculator = ProfitCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Build one calculator for the class; tests only read from it"""
+        cls.calculator = ProfitCalculator()
     
     def test_initialization(self):
         """Test calculator initializes with risk model"""
@@ -168,11 +180,11 @@ class TestProfitCalculator(unittest.TestCase):
         )
         
         # Gross profit should be revenue - gas_cost
-        self.assertAlmostEqual(result['gross_profit'], 1.9, places=5)
+        self.assertAlmostEqual(result['gross_profit'], 1.9, delta=1e-5)
         
         # Adjusted profit should be gross_profit - mev_risk
         expected_adjusted = result['gross_profit'] - result['mev_risk']
-        self.assertAlmostEqual(result['adjusted_profit'], expected_adjusted, places=5)
+        self.assertAlmostEqual(result['adjusted_profit'], expected_adjusted, delta=1e-5)
         
         # MEV risk should be positive
         self.assertGreater(result['mev_risk'], 0)
@@ -241,10 +253,12 @@ class TestProfitCalculator(unittest.TestCase):
 class TestMempoolSimulator(unittest.TestCase):
     """Test MempoolSimulator class"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.simulator = MempoolSimulator()
-        self.calculator = ProfitCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Run the simulation once; every test here reads it read-only"""
+        cls.simulator = MempoolSimulator()
+        cls.calculator = ProfitCalculator()
+        cls.results = cls.simulator.run_simulation(cls.calculator)
     
     def test_initialization(self):
         """Test simulator initializes with correct parameters"""
@@ -256,7 +270,7 @@ class TestMempoolSimulator(unittest.TestCase):
     
     def test_run_simulation(self):
         """Test simulation runs and produces results"""
-        results = self.simulator.run_simulation(self.calculator)
+        results = self.results
         
         self.assertIsInstance(results, list)
         self.assertGreater(len(results), 0)
@@ -268,7 +282,7 @@ class TestMempoolSimulator(unittest.TestCase):
     
     def test_simulation_result_structure(self):
         """Test each simulation result has correct structure"""
-        results = self.simulator.run_simulation(self.calculator)
+        results = self.results
         
         for result in results:
             # Check profit calculator fields
@@ -285,7 +299,7 @@ class TestMempoolSimulator(unittest.TestCase):
     
     def test_simulation_transaction_types(self):
         """Test simulation covers all transaction types"""
-        results = self.simulator.run_simulation(self.calculator)
+        results = self.results
         
         tx_types = set(r['tx_type'] for r in results)
         expected_types = {t.name for t in TransactionType}
@@ -294,7 +308,7 @@ class TestMempoolSimulator(unittest.TestCase):
     
     def test_simulation_congestion_levels(self):
         """Test simulation covers all congestion levels"""
-        results = self.simulator.run_simulation(self.calculator)
+        results = self.results
         
         congestion_levels = set(r['congestion'] for r in results)
         expected_levels = set(self.simulator.congestion_levels)
@@ -303,7 +317,7 @@ class TestMempoolSimulator(unittest.TestCase):
     
     def test_simulation_values_are_numeric(self):
         """Test all simulation result values are numeric"""
-        results = self.simulator.run_simulation(self.calculator)
+        results = self.results
         
         for result in results:
             self.assertIsInstance(result['gross_profit'], (int, float))
@@ -344,45 +358,32 @@ class TestIntegration(unittest.TestCase):
             self.assertIsInstance(result['adjusted_profit'], (int, float))
             self.assertGreater(result['gross_profit'], 0)
     
-    def test_realistic_arbitrage_scenario(self):
-        """Test realistic arbitrage scenario"""
-        calculator = ProfitCalculator()
-        
-        # Realistic values for a typical arbitrage
-        revenue = 1.2  # 20% profit on 1 ETH
-        gas_cost = 0.08  # ~$160 at 2000 gwei
-        tx_value = 1.0
-        
-        profit = calculator.calculate_profit(
-            revenue=revenue,
-            gas_cost=gas_cost,
-            tx_value=tx_value,
-            tx_type=TransactionType.ARBITRAGE,
-            mempool_congestion=0.6
-        )
-        
-        # Verify reasonable values
-        self.assertGreater(profit['gross_profit'], 0)
-        self.assertLess(profit['mev_risk'], profit['gross_profit'])
-        self.assertGreater(profit['risk_ratio'], 0)
-        self.assertLess(profit['risk_ratio'], 1.0)
-    
-    def test_high_value_flash_loan_scenario(self):
-        """Test high-value flash loan scenario"""
+    def test_realistic_scenarios(self):
+        """Test realistic trade scenarios across transaction types"""
         calculator = ProfitCalculator()
         
-        # High-value flash loan scenario
-        profit = calculator.calculate_profit(
-            revenue=50.0,
-            gas_cost=0.5,
-            tx_value=45.0,
-            tx_type=TransactionType.FLASH_LOAN,
-            mempool_congestion=0.7
-        )
+        # (label, params): a typical 1 ETH arbitrage at ~$160 gas, and a
+        # high-value flash loan under heavy congestion
+        scenarios = [
+            ('arbitrage', dict(revenue=1.2, gas_cost=0.08, tx_value=1.0,
+                               tx_type=TransactionType.ARBITRAGE,
+                               mempool_congestion=0.6)),
+            ('flash_loan', dict(revenue=50.0, gas_cost=0.5, tx_value=45.0,
+                                tx_type=TransactionType.FLASH_LOAN,
+                                mempool_congestion=0.7)),
+        ]
         
-        self.assertGreater(profit['gross_profit'], 0)
-        self.assertGreater(profit['mev_risk'], 0)
-        self.assertLess(profit['adjusted_profit'], profit['gross_profit'])
+        for label, params in scenarios:
+            with self.subTest(scenario=label):
+                profit = calculator.calculate_profit(**params)
+                
+                # Verify reasonable values
+                self.assertGreater(profit['gross_profit'], 0)
+                self.assertGreater(profit['mev_risk'], 0)
+                self.assertLess(profit['mev_risk'], profit['gross_profit'])
+                self.assertGreater(profit['risk_ratio'], 0)
+                self.assertLess(profit['risk_ratio'], 1.0)
+                self.assertLess(profit['adjusted_profit'], profit['gross_profit'])
     
     def test_liquidity_provision_low_risk(self):
         """Test that liquidity provision has lower MEV risk"""
@@ -407,16 +408,12 @@ class TestIntegration(unittest.TestCase):
         """Test extreme mempool congestion impact"""
         calculator = ProfitCalculator()
         
-        params = {
-            'revenue': 1.5,
-            'gas_cost': 0.05,
-            'tx_value': 1.0,
-            'tx_type': TransactionType.ARBITRAGE
-        }
-        
-        # Test extreme congestion levels
-        low_congestion = calculator.calculate_profit(**params, mempool_congestion=0.01)
-        high_congestion = calculator.calculate_profit(**params, mempool_congestion=0.99)
+        # Test extreme congestion levels (positional: revenue, gas_cost,
+        # tx_value, tx_type, mempool_congestion)
+        low_congestion = calculator.calculate_profit(
+            1.5, 0.05, 1.0, TransactionType.ARBITRAGE, 0.01)
+        high_congestion = calculator.calculate_profit(
+            1.5, 0.05, 1.0, TransactionType.ARBITRAGE, 0.99)
         
         # Both should produce valid results
         self.assertIsNotNone(low_congestion)
@@ -525,7 +522,7 @@ class TestEdgeCases(unittest.TestCase):
         )
         
         # Gross profit should be zero
-        self.assertAlmostEqual(result['gross_profit'], 0.0, places=5)
+        self.assertAlmostEqual(result['gross_profit'], 0.0, delta=1e-5)
         # Adjusted profit should be negative (due to MEV risk)
         self.assertLess(result['adjusted_profit'], 0)
     
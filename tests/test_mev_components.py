@@ -14,51 +14,68 @@ Test Categories:
 5. Integration Tests - Verify MEV components work together
 6. Dependency Validation - Verify required dependencies are available
 
+Run via pytest; with pytest-xdist installed, ``pytest -n auto`` spreads
+the test classes across worker processes. CI can collect
+machine-readable results with ``pytest -q --junitxml=results.xml``
+instead of parsing verbose runner output.
+
 Author: StableExo
 Related Issues: #229, #230
 """
 
-import sys
+import importlib.util
 import unittest
-from pathlib import Path
-from typing import Dict, Any
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Component imports hoisted to module scope: each in-method `from ... import`
+# re-runs the fromlist machinery even on cached modules, and these were
+# repeated ~30 times across the file. Dependency-availability tests keep
+# their imports in-method since importability is what they assert.
+from src.mev.models.transaction_type import TransactionType
+from src.mev.models.mev_risk_model import MEVRiskModel
+from src.mev.models.profit_calculator import ProfitCalculator
+
+# The sensor modules need web3 at import time; the models only need
+# numpy. On lightweight environments (e.g. a lint-only CI) the sensor
+# tests skip instead of erroring the whole module out at import.
+_HAS_WEB3 = importlib.util.find_spec("web3") is not None
+
+if _HAS_WEB3:
+    from src.mev.sensors.mempool_congestion_sensor import MempoolCongestionSensor
+    from src.mev.sensors.searcher_density_sensor import SearcherDensitySensor
+    from src.mev.sensors.mev_sensor_hub import MEVSensorHub
+else:
+    MempoolCongestionSensor = SearcherDensitySensor = MEVSensorHub = None
+
+# Enum members materialized once; every test that iterates or counts
+# transaction types reuses this tuple instead of walking __members__
+_ALL_TX_TYPES = tuple(TransactionType)
+
+
+# (module, symbol) pairs covered by the consolidated import smoke test
+_IMPORT_TABLE = (
+    ("src.mev.models.transaction_type", "TransactionType"),
+    ("src.mev.models.mev_risk_model", "MEVRiskModel"),
+    ("src.mev.models.profit_calculator", "ProfitCalculator"),
+    ("src.mev.sensors.mempool_congestion_sensor", "MempoolCongestionSensor"),
+    ("src.mev.sensors.searcher_density_sensor", "SearcherDensitySensor"),
+    ("src.mev.sensors.mev_sensor_hub", "MEVSensorHub"),
+)
 
 
 class TestMEVImports(unittest.TestCase):
     """Test that all MEV components can be imported"""
 
-    def test_import_transaction_type(self):
-        """Test TransactionType enum can be imported"""
-        from src.mev.models.transaction_type import TransactionType
-        self.assertIsNotNone(TransactionType)
-
-    def test_import_mev_risk_model(self):
-        """Test MEVRiskModel class can be imported"""
-        from src.mev.models.mev_risk_model import MEVRiskModel
-        self.assertIsNotNone(MEVRiskModel)
-
-    def test_import_profit_calculator(self):
-        """Test ProfitCalculator class can be imported"""
-        from src.mev.models.profit_calculator import ProfitCalculator
-        self.assertIsNotNone(ProfitCalculator)
-
-    def test_import_mempool_congestion_sensor(self):
-        """Test MempoolCongestionSensor class can be imported"""
-        from src.mev.sensors.mempool_congestion_sensor import MempoolCongestionSensor
-        self.assertIsNotNone(MempoolCongestionSensor)
-
-    def test_import_searcher_density_sensor(self):
-        """Test SearcherDensitySensor class can be imported"""
-        from src.mev.sensors.searcher_density_sensor import SearcherDensitySensor
-        self.assertIsNotNone(SearcherDensitySensor)
-
-    def test_import_mev_sensor_hub(self):
-        """Test MEVSensorHub class can be imported"""
-        from src.mev.sensors.mev_sensor_hub import MEVSensorHub
-        self.assertIsNotNone(MEVSensorHub)
+    def test_all_components_importable(self):
+        """Test every MEV module exposes its public class"""
+        # One table walk replaces six per-method TestCase cycles; subTest
+        # keeps the per-symbol reporting the separate methods gave
+        for module, symbol in _IMPORT_TABLE:
+            if not _HAS_WEB3 and module.startswith("src.mev.sensors"):
+                continue
+            with self.subTest(symbol=symbol):
+                self.assertIsNotNone(
+                    getattr(importlib.import_module(module), symbol)
+                )
 
 
 class TestMEVInstantiation(unittest.TestCase):
@@ -66,35 +83,29 @@ class TestMEVInstantiation(unittest.TestCase):
 
     def test_mev_risk_model_instantiation(self):
         """Test MEVRiskModel can be created without parameters"""
-        from src.mev.models.mev_risk_model import MEVRiskModel
-        
         model = MEVRiskModel()
         self.assertIsNotNone(model)
-        self.assertTrue(hasattr(model, 'params'))
-        self.assertTrue(hasattr(model, 'calculate_risk'))
+        # One dir() snapshot instead of a hasattr per name; a failure
+        # lists every missing attribute at once
+        self.assertLessEqual({'params', 'calculate_risk'}, set(dir(model)))
 
     def test_profit_calculator_instantiation(self):
         """Test ProfitCalculator can be created without parameters"""
-        from src.mev.models.profit_calculator import ProfitCalculator
-        
         calc = ProfitCalculator()
         self.assertIsNotNone(calc)
-        self.assertTrue(hasattr(calc, 'calculate_profit'))
-        self.assertTrue(hasattr(calc, 'risk_model'))
+        self.assertLessEqual({'calculate_profit', 'risk_model'}, set(dir(calc)))
 
+    @unittest.skipIf(not _HAS_WEB3, "web3 not installed")
     def test_searcher_density_sensor_instantiation(self):
         """Test SearcherDensitySensor can be created with minimal parameters"""
-        from src.mev.sensors.searcher_density_sensor import SearcherDensitySensor
-        
         # Create with empty routers list for testing
         sensor = SearcherDensitySensor(routers=[])
         self.assertIsNotNone(sensor)
         self.assertTrue(hasattr(sensor, 'routers'))
 
+    @unittest.skipIf(not _HAS_WEB3, "web3 not installed")
     def test_mev_sensor_hub_instantiation(self):
         """Test MEVSensorHub can be created without parameters"""
-        from src.mev.sensors.mev_sensor_hub import MEVSensorHub
-        
         hub = MEVSensorHub()
         self.assertIsNotNone(hub)
         self.assertTrue(hasattr(hub, 'cache'))
@@ -105,8 +116,6 @@ class TestTransactionTypeEnum(unittest.TestCase):
 
     def test_transaction_type_enum_values(self):
         """Test TransactionType has expected enum values"""
-        from src.mev.models.transaction_type import TransactionType
-        
         # Verify enum has expected MEV-related transaction types
         self.assertTrue(hasattr(TransactionType, 'ARBITRAGE'))
         self.assertTrue(hasattr(TransactionType, 'LIQUIDITY_PROVISION'))
@@ -115,29 +124,36 @@ class TestTransactionTypeEnum(unittest.TestCase):
 
     def test_transaction_type_enum_count(self):
         """Test TransactionType has the expected number of values"""
-        from src.mev.models.transaction_type import TransactionType
-        
         # Should have 4 transaction types
-        enum_values = list(TransactionType)
-        self.assertEqual(len(enum_values), 4)
+        self.assertEqual(len(_ALL_TX_TYPES), 4)
+
+    def test_transaction_type_hashes_as_int(self):
+        """Test TransactionType members hash by integer value"""
+        # IntEnum members share the int hash, so dicts keyed by tx type
+        # never hash the member name string
+        self.assertEqual(hash(TransactionType.ARBITRAGE),
+                         hash(int(TransactionType.ARBITRAGE)))
 
     def test_transaction_type_enum_values_are_numeric(self):
         """Test TransactionType enum values are integers"""
-        from src.mev.models.transaction_type import TransactionType
+        from enum import IntEnum
         
-        for tx_type in TransactionType:
-            self.assertIsInstance(tx_type.value, int)
+        # IntEnum guarantees integer values at class-definition time, so
+        # one subclass check replaces a per-member isinstance loop
+        self.assertTrue(issubclass(TransactionType, IntEnum))
 
 
 class TestMEVRiskModel(unittest.TestCase):
     """Test MEVRiskModel basic functionality"""
 
+    @classmethod
+    def setUpClass(cls):
+        """One shared model for the read-only tests"""
+        cls.model = MEVRiskModel()
+
     def test_mev_risk_calculation(self):
         """Test MEVRiskModel can calculate risk"""
-        from src.mev.models.mev_risk_model import MEVRiskModel
-        from src.mev.models.transaction_type import TransactionType
-        
-        model = MEVRiskModel()
+        model = self.model
         
         # Test risk calculation with valid parameters
         risk = model.calculate_risk(
@@ -153,10 +169,7 @@ class TestMEVRiskModel(unittest.TestCase):
 
     def test_mev_risk_model_parameters(self):
         """Test MEVRiskModel has expected parameters"""
-        from src.mev.models.mev_risk_model import MEVRiskModel
-        
-        model = MEVRiskModel()
-        params = model.get_params()
+        params = self.model.get_params()
         
         self.assertIn('base_risk', params)
         self.assertIn('value_sensitivity', params)
@@ -166,8 +179,8 @@ class TestMEVRiskModel(unittest.TestCase):
 
     def test_mev_risk_model_calibration(self):
         """Test MEVRiskModel calibration method works"""
-        from src.mev.models.mev_risk_model import MEVRiskModel
-        
+        # Calibration mutates params, so this test builds its own model
+        # rather than touching the shared read-only instance
         model = MEVRiskModel()
         
         # Test calibration with new parameters
@@ -182,42 +195,69 @@ class TestMEVRiskModel(unittest.TestCase):
         self.assertEqual(updated_params['base_risk'], 0.002)
         self.assertEqual(updated_params['value_sensitivity'], 0.20)
 
-    def test_mev_risk_different_transaction_types(self):
-        """Test MEVRiskModel calculates different risks for different transaction types"""
-        from src.mev.models.mev_risk_model import MEVRiskModel
-        from src.mev.models.transaction_type import TransactionType
+    def test_mev_risk_batch_matches_scalar(self):
+        """Test the vectorized batch path agrees with scalar calculate_risk"""
+        import numpy as np
         
-        model = MEVRiskModel()
+        tx_values = np.array([0.0, 10.0, 1000.0, 50000.0])
+        tx_types = np.array([t.value for t in _ALL_TX_TYPES])
+        congestion = np.array([0.0, 0.3, 0.5, 0.9])
         
-        # Calculate risk for different transaction types
-        risk_arbitrage = model.calculate_risk(
-            tx_value=1000.0,
-            gas_price=50.0,
-            tx_type=TransactionType.ARBITRAGE,
-            mempool_congestion=0.5
-        )
+        batch = self.model.calculate_risk_batch(tx_values, tx_types, congestion)
+        scalar = [
+            self.model.calculate_risk(
+                tx_value=v, gas_price=50.0,
+                tx_type=TransactionType(t), mempool_congestion=c
+            )
+            for v, t, c in zip(tx_values, tx_types, congestion)
+        ]
+        np.testing.assert_allclose(batch, scalar)
+
+    def test_risk_kernel_jit_matches_python(self):
+        """Test the compiled risk kernel agrees with its Python definition"""
+        from src.mev.models._risk_numba import _risk_core
         
-        risk_flash_loan = model.calculate_risk(
-            tx_value=1000.0,
-            gas_price=50.0,
-            tx_type=TransactionType.FLASH_LOAN,
-            mempool_congestion=0.5
-        )
+        if not hasattr(_risk_core, 'py_func'):
+            raise unittest.SkipTest("numba not installed; kernel is pure Python")
+        
+        # (tx_value, p_exploit, congestion, base_risk, value_sensitivity,
+        #  congestion_factor, searcher_density)
+        args = (1000.0, 0.7, 0.5, 0.001, 0.15, 0.3, 0.25)
+        self.assertAlmostEqual(_risk_core(*args), _risk_core.py_func(*args))
+
+    def test_mev_risk_different_transaction_types(self):
+        """Test MEVRiskModel calculates different risks for different transaction types"""
+        model = self.model
+        
+        # One model and one parameter table service every variant;
+        # only tx_type differs between calls
+        risks = {
+            tx_type: model.calculate_risk(
+                tx_value=1000.0,
+                gas_price=50.0,
+                tx_type=tx_type,
+                mempool_congestion=0.5
+            )
+            for tx_type in _ALL_TX_TYPES
+        }
         
         # Flash loans should have higher risk than arbitrage
         # (based on frontrun_probability: FLASH_LOAN=0.8 vs ARBITRAGE=0.7)
-        self.assertGreater(risk_flash_loan, risk_arbitrage)
+        self.assertGreater(risks[TransactionType.FLASH_LOAN],
+                           risks[TransactionType.ARBITRAGE])
 
 
 class TestProfitCalculator(unittest.TestCase):
     """Test ProfitCalculator basic functionality"""
 
+    @classmethod
+    def setUpClass(cls):
+        """One shared calculator (and its internal risk model) per class"""
+        cls.calc = ProfitCalculator()
+
     def test_profit_calculation_with_mev(self):
         """Test ProfitCalculator calculates profit with MEV risk"""
-        from src.mev.models.profit_calculator import ProfitCalculator
-        from src.mev.models.transaction_type import TransactionType
-        
-        calc = ProfitCalculator()
+        calc = self.calc
         
         # Test profit calculation
         result = calc.calculate_profit(
@@ -238,10 +278,7 @@ class TestProfitCalculator(unittest.TestCase):
 
     def test_profit_calculation_values(self):
         """Test ProfitCalculator produces expected values"""
-        from src.mev.models.profit_calculator import ProfitCalculator
-        from src.mev.models.transaction_type import TransactionType
-        
-        calc = ProfitCalculator()
+        calc = self.calc
         
         result = calc.calculate_profit(
             revenue=1000.0,
@@ -251,21 +288,24 @@ class TestProfitCalculator(unittest.TestCase):
             mempool_congestion=0.5
         )
         
-        # Gross profit should be revenue - gas_cost
-        self.assertEqual(result['gross_profit'], 950.0)
+        # Gross profit should be revenue - gas_cost; compared to nine
+        # places rather than bit-exactly so SIMD/fastmath reassociation
+        # in the kernels cannot break the test
+        self.assertAlmostEqual(result['gross_profit'], 950.0, places=9)
         
         # Adjusted profit should be gross profit - mev_risk
-        self.assertEqual(result['adjusted_profit'], result['gross_profit'] - result['mev_risk'])
+        self.assertAlmostEqual(
+            result['adjusted_profit'],
+            result['gross_profit'] - result['mev_risk'],
+            places=9
+        )
         
         # MEV risk should be positive
         self.assertGreater(result['mev_risk'], 0.0)
 
     def test_profit_calculation_error_handling(self):
         """Test ProfitCalculator handles invalid inputs"""
-        from src.mev.models.profit_calculator import ProfitCalculator
-        from src.mev.models.transaction_type import TransactionType
-        
-        calc = ProfitCalculator()
+        calc = self.calc
         
         # Test negative revenue raises error
         with self.assertRaises(ValueError):
@@ -278,114 +318,83 @@ class TestProfitCalculator(unittest.TestCase):
 
     def test_profit_calculator_has_risk_model(self):
         """Test ProfitCalculator has access to underlying MEV risk model"""
-        from src.mev.models.profit_calculator import ProfitCalculator
-        from src.mev.models.mev_risk_model import MEVRiskModel
-        
-        calc = ProfitCalculator()
+        calc = self.calc
         risk_model = calc.get_risk_model()
         
         self.assertIsNotNone(risk_model)
         self.assertIsInstance(risk_model, MEVRiskModel)
 
 
+@unittest.skipIf(not _HAS_WEB3, "web3 not installed")
 class TestMEVSensorHub(unittest.TestCase):
     """Test MEVSensorHub integration"""
 
-    def test_sensor_hub_has_cache(self):
-        """Test MEVSensorHub has caching mechanism"""
-        from src.mev.sensors.mev_sensor_hub import MEVSensorHub
-        
-        hub = MEVSensorHub()
-        
-        self.assertTrue(hasattr(hub, 'cache'))
-        self.assertTrue(hasattr(hub, 'cache_ttl'))
-
-    def test_sensor_hub_has_metrics_method(self):
-        """Test MEVSensorHub can retrieve metrics"""
-        from src.mev.sensors.mev_sensor_hub import MEVSensorHub
-        
-        hub = MEVSensorHub()
-        
-        self.assertTrue(hasattr(hub, 'get_metrics'))
-
-    def test_sensor_hub_cache_methods(self):
-        """Test MEVSensorHub cache methods exist"""
-        from src.mev.sensors.mev_sensor_hub import MEVSensorHub
-        
-        hub = MEVSensorHub()
-        
-        self.assertTrue(hasattr(hub, '_cache_result'))
-        self.assertTrue(hasattr(hub, '_is_cache_valid'))
+    @classmethod
+    def setUpClass(cls):
+        """One shared hub; these tests only probe its interface"""
+        cls.hub = MEVSensorHub()
+
+    def test_sensor_hub_interface(self):
+        """Test MEVSensorHub exposes cache state, cache helpers and metrics"""
+        # The three former per-aspect tests probed the same object; one
+        # dir() snapshot covers the whole expected surface in one check
+        self.assertLessEqual(
+            {'cache', 'cache_ttl', 'get_metrics', '_cache_result', '_is_cache_valid'},
+            set(dir(self.hub))
+        )
 
 
+@unittest.skipIf(not _HAS_WEB3, "web3 not installed")
 class TestSearcherDensitySensor(unittest.TestCase):
     """Test SearcherDensitySensor functionality"""
 
     def test_searcher_density_sensor_attributes(self):
         """Test SearcherDensitySensor has expected attributes"""
-        from src.mev.sensors.searcher_density_sensor import SearcherDensitySensor
-        
         routers = ['Uniswap V3', 'Sushiswap']
         sensor = SearcherDensitySensor(routers=routers)
         
         self.assertEqual(sensor.routers, routers)
-        self.assertTrue(hasattr(sensor, 'bot_activity_data'))
-        self.assertTrue(hasattr(sensor, 'mev_transaction_ratio'))
-        self.assertTrue(hasattr(sensor, 'sandwich_attack_score'))
+        self.assertLessEqual(
+            {'bot_activity_data', 'mev_transaction_ratio', 'sandwich_attack_score'},
+            set(dir(sensor))
+        )
 
     def test_searcher_density_sensor_methods(self):
         """Test SearcherDensitySensor has expected methods"""
-        from src.mev.sensors.searcher_density_sensor import SearcherDensitySensor
-        
         sensor = SearcherDensitySensor(routers=[])
         
-        self.assertTrue(hasattr(sensor, 'track_activity'))
-        self.assertTrue(hasattr(sensor, 'calculate_mev_transaction_ratio'))
-        self.assertTrue(hasattr(sensor, 'calculate_sandwich_attack_score'))
-        self.assertTrue(hasattr(sensor, 'analyze_bot_clustering'))
+        self.assertLessEqual(
+            {'track_activity', 'calculate_mev_transaction_ratio',
+             'calculate_sandwich_attack_score', 'analyze_bot_clustering'},
+            set(dir(sensor))
+        )
 
 
 class TestDependencies(unittest.TestCase):
     """Test that required dependencies are available"""
 
-    def test_numpy_available(self):
-        """Test numpy dependency is installed and importable"""
-        import numpy as np
-        self.assertIsNotNone(np)
-        
-        # Test basic numpy functionality
-        arr = np.array([1, 2, 3])
-        self.assertEqual(len(arr), 3)
-
-    def test_web3_available(self):
-        """Test web3 dependency is installed and importable"""
-        from web3 import Web3
-        self.assertIsNotNone(Web3)
-        
-        # Test Web3 class is available (instantiation tested in actual sensor tests)
-        self.assertTrue(hasattr(Web3, 'HTTPProvider'))
-        self.assertTrue(hasattr(Web3, 'is_connected'))
-
-    def test_pandas_available(self):
-        """Test pandas dependency is installed and importable"""
-        import pandas as pd
-        self.assertIsNotNone(pd)
-
-    def test_sklearn_available(self):
-        """Test scikit-learn dependency is installed and importable"""
-        import sklearn
-        self.assertIsNotNone(sklearn)
+    def test_required_dependencies_installed(self):
+        """Test every runtime dependency resolves to an installed package"""
+        # find_spec answers "is it installed?" from package metadata
+        # without executing the heavy top-level imports of pandas and
+        # sklearn or pulling in web3's crypto backends
+        for name in ("numpy", "web3", "pandas", "sklearn"):
+            with self.subTest(name=name):
+                self.assertIsNotNone(importlib.util.find_spec(name))
 
 
 class TestMEVIntegration(unittest.TestCase):
     """Test integration between MEV components"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Shared calculator and risk model for the integration checks"""
+        cls.calc = ProfitCalculator()
+        cls.model = MEVRiskModel()
+
     def test_profit_calculator_uses_risk_model(self):
         """Test ProfitCalculator integrates with MEVRiskModel"""
-        from src.mev.models.profit_calculator import ProfitCalculator
-        from src.mev.models.transaction_type import TransactionType
-        
-        calc = ProfitCalculator()
+        calc = self.calc
         
         # Calculate profit - this should internally use MEVRiskModel
         result = calc.calculate_profit(
@@ -402,94 +411,16 @@ class TestMEVIntegration(unittest.TestCase):
 
     def test_transaction_type_enum_used_by_models(self):
         """Test TransactionType enum is properly used by MEV models"""
-        from src.mev.models.mev_risk_model import MEVRiskModel
-        from src.mev.models.transaction_type import TransactionType
-        
-        model = MEVRiskModel()
         
         # All transaction types should have frontrun probabilities
-        params = model.get_params()
+        params = self.model.get_params()
         frontrun_probs = params['frontrun_probability']
         
-        for tx_type in TransactionType:
-            self.assertIn(tx_type, frontrun_probs)
-            self.assertIsInstance(frontrun_probs[tx_type], float)
-            self.assertGreaterEqual(frontrun_probs[tx_type], 0.0)
-            self.assertLessEqual(frontrun_probs[tx_type], 1.0)
-
-
-def run_test_suite():
-    """Run the complete MEV component test suite with formatted output"""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes in order
-    test_classes = [
-        TestMEVImports,
-        TestMEVInstantiation,
-        TestTransactionTypeEnum,
-        TestMEVRiskModel,
-        TestProfitCalculator,
-        TestMEVSensorHub,
-        TestSearcherDensitySensor,
-        TestDependencies,
-        TestMEVIntegration,
-    ]
-    
-    for test_class in test_classes:
-        suite.addTests(loader.loadTestsFromTestCase(test_class))
-    
-    # Run tests with verbosity
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return result
-
-
-def print_summary(result):
-    """Print formatted test summary"""
-    total_tests = result.testsRun
-    failures = len(result.failures)
-    errors = len(result.errors)
-    skipped = len(result.skipped)
-    passed = total_tests - failures - errors - skipped
-    success_rate = (passed / total_tests * 100) if total_tests > 0 else 0
-    
-    print("\n" + "=" * 70)
-    print("MEV COMPONENT TEST SUITE - SUMMARY")
-    print("=" * 70)
-    print(f"Total Tests:     {total_tests}")
-    print(f"Passed:          {passed} ✓")
-    print(f"Failed:          {failures} ✗")
-    print(f"Errors:          {errors} ✗")
-    print(f"Skipped:         {skipped}")
-    print(f"Success Rate:    {success_rate:.1f}%")
-    print("=" * 70)
-    
-    if result.wasSuccessful():
-        print("\n✅ ALL MEV COMPONENT TESTS PASSED!")
-        print("Dependencies are properly installed and MEV system is operational.")
-    else:
-        print("\n❌ SOME TESTS FAILED")
-        print("Review the output above for details.")
-    
-    print()
-
-
-if __name__ == '__main__':
-    print("=" * 70)
-    print("MEV COMPONENT TEST SUITE")
-    print("=" * 70)
-    print("Testing MEV models, sensors, and integrations")
-    print("Dependencies: web3, numpy, pandas, scikit-learn")
-    print("=" * 70)
-    print()
-    
-    # Run the test suite
-    result = run_test_suite()
-    
-    # Print formatted summary
-    print_summary(result)
-    
-    # Exit with appropriate code
-    sys.exit(0 if result.wasSuccessful() else 1)
+        for tx_type in _ALL_TX_TYPES:
+            with self.subTest(tx_type=tx_type):
+                self.assertIn(tx_type, frontrun_probs)
+                prob = frontrun_probs[tx_type]
+                self.assertIsInstance(prob, float)
+                # One chained comparison instead of two assert* calls,
+                # each of which formats a message even on success
+                self.assertTrue(0.0 <= prob <= 1.0)